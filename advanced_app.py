@@ -4,9 +4,10 @@ Advanced Flask Reddit Scraper
 Complete analytics dashboard with sentiment analysis, engagement metrics, and Excel export
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, jsonify, send_file, stream_with_context
 import json
 import os
+import sys
 import io
 import praw
 import pandas as pd
@@ -14,15 +15,28 @@ from datetime import datetime, timedelta
 import tempfile
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import logging
-from threading import Thread
+import atexit
+from threading import Thread, Event, Lock, RLock, BoundedSemaphore
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue, Full, Empty
+from collections import OrderedDict, deque
+from operator import itemgetter
+from functools import lru_cache
+import heapq
 from uuid import uuid4
 import sqlite3
 import hashlib
 import hmac
 from cryptography.fernet import Fernet
 import base64
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 
@@ -108,10 +122,41 @@ def init_database():
         )
     ''')
     
+    # WAL lets the dashboard and slash-command reads proceed while usage is being logged;
+    # the journal mode is stored in the database file, so it only needs setting once
+    cursor.execute('PRAGMA journal_mode=WAL')
+    
     conn.commit()
     conn.close()
     print("[DB] Multi-tenant database initialized")
 
+# Connections are reused across requests instead of being opened (and their schema
+# re-read) per call; at most DB_POOL_SIZE idle connections are kept
+DB_POOL_SIZE = 8
+_db_pool = Queue(maxsize=DB_POOL_SIZE)
+
+def get_db_connection():
+    """Take an idle connection from the pool, opening a new one if none is free"""
+    try:
+        return _db_pool.get_nowait()
+    except Empty:
+        pass
+    # Pooled connections move between request threads, but only one thread uses each at a time
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA cache_size=-20000')
+    return conn
+
+def release_db_connection(conn):
+    """Return a connection to the pool, discarding any uncommitted changes as close() would"""
+    if conn.in_transaction:
+        conn.rollback()
+    try:
+        _db_pool.put_nowait(conn)
+    except Full:
+        conn.close()
+
 def encrypt_token(token):
     """Encrypt sensitive tokens before storing"""
     if not token:
@@ -130,12 +175,12 @@ def decrypt_token(encrypted_token):
 
 def get_workspace_by_team_id(team_id):
     """Get workspace data by Slack team ID"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     cursor.execute('SELECT * FROM workspaces WHERE team_id = ? AND is_active = TRUE', (team_id,))
     row = cursor.fetchone()
-    conn.close()
+    release_db_connection(conn)
     
     if row:
         columns = ['id', 'team_id', 'team_name', 'bot_token', 'bot_user_id', 'scope', 
@@ -156,7 +201,7 @@ def get_workspace_by_team_id(team_id):
 
 def store_workspace(team_id, team_name, bot_token, bot_user_id, scope, installer_user_id=None):
     """Store new workspace installation"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     encrypted_bot_token = encrypt_token(bot_token)
@@ -192,11 +237,11 @@ def store_workspace(team_id, team_name, bot_token, bot_user_id, scope, installer
         conn.rollback()
         return None
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 def log_usage(workspace_id, user_id, command, search_term=None, result_count=0, success=True, error=None):
     """Log command usage for analytics and billing"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     try:
@@ -218,7 +263,7 @@ def log_usage(workspace_id, user_id, command, search_term=None, result_count=0,
     except Exception as e:
         print(f"[DB] Error logging usage: {e}")
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 # Initialize database on startup
 init_database()
@@ -530,7 +575,7 @@ def workspace_dashboard():
         return 'Unauthorized', 401
     
     # Get all workspaces with usage stats
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     cursor.execute('''
@@ -565,7 +610,7 @@ def workspace_dashboard():
     cursor.execute('SELECT COUNT(*) FROM usage_logs WHERE timestamp > datetime("now", "-24 hours")')
     searches_today = cursor.fetchone()[0]
     
-    conn.close()
+    release_db_connection(conn)
     
     return f'''
     <!DOCTYPE html>
@@ -870,7 +915,7 @@ def billing_dashboard():
     if auth_key != os.getenv('ADMIN_KEY', 'admin_secret_key'):
         return 'Unauthorized', 401
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     # Get billing stats
@@ -910,7 +955,7 @@ def billing_dashboard():
     ''')
     top_users = cursor.fetchall()
     
-    conn.close()
+    release_db_connection(conn)
     
     return f'''
     <!DOCTYPE html>
@@ -996,17 +1041,17 @@ def update_workspace_status(team_id):
         
         is_active = data.get('active', True)
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('UPDATE workspaces SET is_active = ? WHERE team_id = ?', (is_active, team_id))
         
         if cursor.rowcount == 0:
-            conn.close()
+            release_db_connection(conn)
             return jsonify({'success': False, 'error': 'Workspace not found'})
         
         conn.commit()
-        conn.close()
+        release_db_connection(conn)
         
         return jsonify({'success': True, 'message': f'Workspace {"activated" if is_active else "deactivated"}'})
         
@@ -1023,17 +1068,17 @@ def reset_workspace_usage(team_id):
         if auth_key != os.getenv('ADMIN_KEY', 'admin_secret_key'):
             return jsonify({'success': False, 'error': 'Unauthorized'}), 401
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         cursor.execute('UPDATE workspaces SET usage_count = 0 WHERE team_id = ?', (team_id,))
         
         if cursor.rowcount == 0:
-            conn.close()
+            release_db_connection(conn)
             return jsonify({'success': False, 'error': 'Workspace not found'})
         
         conn.commit()
-        conn.close()
+        release_db_connection(conn)
         
         return jsonify({'success': True, 'message': 'Usage count reset to 0'})
         
@@ -1061,7 +1106,7 @@ def workspace_logs(team_id):
     if auth_key != os.getenv('ADMIN_KEY', 'admin_secret_key'):
         return 'Unauthorized', 401
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     # Get workspace info
@@ -1069,6 +1114,7 @@ def workspace_logs(team_id):
     workspace = cursor.fetchone()
     
     if not workspace:
+        release_db_connection(conn)
         return 'Workspace not found', 404
     
     # Get usage logs
@@ -1082,7 +1128,7 @@ def workspace_logs(team_id):
     ''', (workspace[0],))  # workspace[0] is the ID
     
     logs = cursor.fetchall()
-    conn.close()
+    release_db_connection(conn)
     
     return f'''
     <!DOCTYPE html>
@@ -1115,8 +1161,79 @@ def workspace_logs(team_id):
     </html>
     '''
 
+class SlidingLimiter:
+    """Client-side sliding-window rate limiter shared by all Reddit API calls"""
+    
+    def __init__(self, limit=55, window=60):
+        self.limit = limit
+        self.window = window
+        self._calls = deque()
+        self._lock = Lock()
+    
+    def acquire(self):
+        """Block until a call fits in the window, then record it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.window:
+                    self._calls.popleft()
+                if len(self._calls) < self.limit:
+                    self._calls.append(now)
+                    return
+                wait = self.window - (now - self._calls[0])
+            time.sleep(wait)
+
+# Stay just under Reddit's 60 requests/minute OAuth cap to avoid 429 back-off stalls
+reddit_limiter = SlidingLimiter(limit=55, window=60)
+
+class RateLimitedSession(requests.Session):
+    """requests session that takes a reddit_limiter slot before every outbound request"""
+    
+    def request(self, *args, **kwargs):
+        reddit_limiter.acquire()
+        return super().request(*args, **kwargs)
+
+# praw.Reddit instances are not thread-safe (token and ratelimit state), so each search checks
+# one out of a pool and returns it when done; idle instances keep their OAuth token, and all of
+# them share one pooled session so connections are reused across requests
+REDDIT_POOL_SIZE = 32
+REDDIT_INSTANCE_POOL_SIZE = 8
+_reddit_session = None
+_reddit_session_lock = Lock()
+_reddit_pool = Queue(maxsize=REDDIT_INSTANCE_POOL_SIZE)
+
+def create_reddit_session():
+    """Build a rate-limited requests session with a connection pool sized for concurrent searches"""
+    session = RateLimitedSession()
+    retry = Retry(
+        total=3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        backoff_factor=0.25,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=REDDIT_POOL_SIZE, pool_maxsize=REDDIT_POOL_SIZE, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+def get_reddit_session():
+    """Get the pooled session shared by every Reddit instance, creating it on first use"""
+    global _reddit_session
+    if _reddit_session is None:
+        with _reddit_session_lock:
+            if _reddit_session is None:
+                _reddit_session = create_reddit_session()
+    return _reddit_session
+
 def get_reddit_instance():
-    """Get Reddit API instance"""
+    """Take an idle Reddit API instance from the pool, creating one if none is free
+
+    The caller has it to itself until it hands it back with release_reddit_instance().
+    """
+    try:
+        return _reddit_pool.get_nowait()
+    except Empty:
+        pass
+    
     try:
         client_id = os.getenv('REDDIT_CLIENT_ID', '').strip()
         client_secret = os.getenv('REDDIT_CLIENT_SECRET', '').strip()
@@ -1129,98 +1246,421 @@ def get_reddit_instance():
         return praw.Reddit(
             client_id=client_id,
             client_secret=client_secret,
-            user_agent=user_agent
+            user_agent=user_agent,
+            requestor_kwargs={'session': get_reddit_session()}
         )
     except Exception as e:
         print(f"Reddit API error: {e}")
         return None
 
+def release_reddit_instance(reddit):
+    """Return an instance from get_reddit_instance() to the pool once its listings are consumed"""
+    if reddit is None:
+        return
+    try:
+        _reddit_pool.put_nowait(reddit)
+    except Full:
+        pass
+
+# Sentiment lexicon, built once rather than on every call
+POSITIVE_WORDS = frozenset(('good', 'great', 'excellent', 'amazing', 'awesome', 'love', 'best', 'fantastic', 'wonderful', 'perfect', 'incredible', 'outstanding', 'brilliant', 'superb'))
+NEGATIVE_WORDS = frozenset(('bad', 'terrible', 'awful', 'hate', 'worst', 'horrible', 'disgusting', 'stupid', 'ugly', 'pathetic', 'useless', 'garbage', 'trash', 'disappointing'))
+WORD_RE = re.compile(r'[a-z]+')
+
+# Only the start of long posts is scored, which bounds the cost of huge selftexts
+SENTIMENT_MAX_CHARS = 2048
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after `ttl` seconds"""
+    
+    def __init__(self, ttl, maxsize=1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, stored_at = entry
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+# Subreddit accessibility lookups, refreshed every 10 minutes so new subreddits show up
+subreddit_access_cache = TTLCache(ttl=600, maxsize=2048)
+# Full discover_subreddits result lists per search term, so paging doesn't re-query Reddit
+discover_cache = TTLCache(ttl=300, maxsize=256)
+# perform_reddit_search results, so repeated slash command searches skip Reddit for a while
+reddit_search_cache = TTLCache(ttl=120, maxsize=256)
+
+# Most subreddits combined into one r/a+b+c search
+MAX_MULTI_SUBREDDITS = 50
+
+# Reddit's listing time windows, narrowest first, with the days each one is sure to cover
+REDDIT_TIME_FILTERS = ((1, 'day'), (7, 'week'), (28, 'month'), (365, 'year'))
+
+def time_filter_for_days(days_back):
+    """Narrowest Reddit time_filter that still covers the last `days_back` days"""
+    if days_back > 0:
+        for days, time_filter in REDDIT_TIME_FILTERS:
+            if days_back <= days:
+                return time_filter
+    return 'all'
+
+def accessible_subreddits(reddit, names):
+    """Filter subreddit names down to the ones that can be searched, reusing recent answers
+
+    Names without a cached answer are looked up together in one /api/info request; missing,
+    banned, private and quarantined subreddits are filtered out.
+    """
+    accessible = {}
+    unknown = []
+    for name in names:
+        cached = subreddit_access_cache.get(name.lower())
+        if cached is None:
+            unknown.append(name)
+        else:
+            accessible[name.lower()] = cached
+    
+    if unknown:
+        found = set()
+        for sub in reddit.info(subreddits=unknown):
+            # Fields come with the info response; vars() avoids a lazy fetch per subreddit
+            fields = vars(sub)
+            if fields.get('subreddit_type') != 'private' and not fields.get('quarantine', False):
+                found.add(fields['display_name'].lower())
+        for name in unknown:
+            key = name.lower()
+            accessible[key] = key in found
+            subreddit_access_cache.set(key, accessible[key])
+    
+    return [name for name in names if accessible[name.lower()]]
+
+def prefetch(iterable, maxsize=200):
+    """Iterate on a background thread so network fetches overlap with the consumer's processing"""
+    buffer = Queue(maxsize=maxsize)
+    stop = Event()
+    
+    def put(entry):
+        # Give up once the consumer has gone away instead of blocking forever on a full queue
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.5)
+                return True
+            except Full:
+                continue
+        return False
+    
+    def produce():
+        try:
+            for item in iterable:
+                if not put(('item', item)):
+                    return
+        except Exception as e:
+            put(('error', e))
+            return
+        put(('done', None))
+    
+    producer = Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            kind, value = buffer.get()
+            if kind == 'done':
+                return
+            if kind == 'error':
+                raise value
+            yield value
+    finally:
+        stop.set()
+        # Once this returns the listing (and its Reddit instance) is no longer in use
+        producer.join()
+
 def simple_sentiment(text):
     """Simple sentiment analysis without external libraries"""
-    if not text:
+    text = text[:SENTIMENT_MAX_CHARS] if text else ''
+    if not text or text.isspace():
         return 'neutral', 0.0
     
-    text = text.lower()
-    positive_words = ['good', 'great', 'excellent', 'amazing', 'awesome', 'love', 'best', 'fantastic', 'wonderful', 'perfect', 'incredible', 'outstanding', 'brilliant', 'superb']
-    negative_words = ['bad', 'terrible', 'awful', 'hate', 'worst', 'horrible', 'disgusting', 'stupid', 'ugly', 'pathetic', 'useless', 'garbage', 'trash', 'disappointing']
-    
-    pos_count = sum(word in text for word in positive_words)
-    neg_count = sum(word in text for word in negative_words)
+    # Tokenize once and count distinct lexicon words, so 'good' no longer matches inside 'goodbye'
+    words = WORD_RE.findall(text.lower())
+    pos_count = len(POSITIVE_WORDS.intersection(words))
+    neg_count = len(NEGATIVE_WORDS.intersection(words))
     
     if pos_count > neg_count:
-        return 'positive', (pos_count - neg_count) / max(len(text.split()), 1)
+        return 'positive', (pos_count - neg_count) / max(len(words), 1)
     elif neg_count > pos_count:
-        return 'negative', -(neg_count - pos_count) / max(len(text.split()), 1)
+        return 'negative', -(neg_count - pos_count) / max(len(words), 1)
     else:
         return 'neutral', 0.0
 
-def calculate_metrics(post, keywords):
-    """Calculate engagement and relevance metrics"""
-    # Engagement rate
-    engagement_rate = (post.num_comments / max(post.score, 1)) * 100 if post.score > 0 else 0
-    
-    # Relevance score
-    title = post.title.lower()
-    content = (post.selftext or '').lower()
-    relevance_score = 0
-    
+@lru_cache(maxsize=256)
+def compile_keywords(keywords):
+    """Lowercase keywords and compile their word-boundary patterns, plus one combined pattern for all of them"""
+    compiled = []
     for keyword in keywords:
         keyword = keyword.lower()
+        compiled.append((keyword, re.compile(r'\b' + re.escape(keyword) + r'\b')))
+    any_keyword = re.compile(r'\b(?:' + '|'.join(re.escape(keyword) for keyword, _ in compiled) + r')\b')
+    return tuple(compiled), any_keyword
+
+def compute_engagement_rate(score, num_comments):
+    """Comments per 100 upvotes, or 0 for posts without a positive score"""
+    return (num_comments / max(score, 1)) * 100 if score > 0 else 0
+
+def calculate_relevance(title, content, compiled_keywords):
+    """Relevance score (0-100) of already-lowercased title and body text for keywords from compile_keywords()"""
+    relevance_score = 0
+    
+    # One scan with the combined pattern rules out every per-keyword word match in the usual case
+    keyword_patterns, any_keyword = compiled_keywords
+    title_has_match = any_keyword.search(title) is not None
+    content_has_match = any_keyword.search(content) is not None
+    
+    for keyword, word_pattern in keyword_patterns:
         # Title matches get higher score
         relevance_score += title.count(keyword) * 20
         # Content matches
         relevance_score += content.count(keyword) * 10
         # Exact word boundary matches get bonus
-        if re.search(r'\\b' + re.escape(keyword) + r'\\b', title):
+        if title_has_match and word_pattern.search(title):
             relevance_score += 15
-        if re.search(r'\\b' + re.escape(keyword) + r'\\b', content):
+        if content_has_match and word_pattern.search(content):
             relevance_score += 5
     
-    return min(relevance_score, 100), engagement_rate
+    return min(relevance_score, 100)
+
+def calculate_metrics(post, compiled_keywords):
+    """Calculate engagement and relevance metrics for keywords prepared by compile_keywords()"""
+    engagement_rate = compute_engagement_rate(post.score, post.num_comments)
+    relevance_score = calculate_relevance(post.title.lower(), (post.selftext or '').lower(), compiled_keywords)
+    return relevance_score, engagement_rate
+
+# ============ JSON HELPERS ============
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+def encode_json(data, pretty=False):
+    """Serialize data to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 if pretty else None)
+    return json.dumps(data, indent=2 if pretty else None, default=str).encode('utf-8')
+
+def json_response(payload, status=200):
+    """Flask response with a JSON body serialized by encode_json"""
+    return Response(encode_json(payload), status=status, mimetype='application/json')
+
+def decode_json(raw):
+    """Parse JSON from str or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 # ============ SLACK INTEGRATION SYSTEM ============
 
-def load_slack_settings():
-    """Load Slack integration settings from file"""
-    settings_file = 'slack_settings.json'
+SLACK_SETTINGS_FILE = 'slack_settings.json'
+
+# Settings are kept in memory and only re-read when the file changes on disk (e.g. edited by
+# hand or by another process)
+slack_settings_lock = RLock()
+_slack_settings_cache = None
+_slack_settings_mtime = None
+# (settings dict it was built from, active integrations with valid webhooks)
+_notifiable_integrations = (None, [])
+
+def get_slack_settings_mtime():
+    """Modification time of the settings file, or None if it doesn't exist"""
     try:
-        if os.path.exists(settings_file):
-            with open(settings_file, 'r') as f:
-                return json.load(f)
-    except Exception as e:
-        print(f"Error loading Slack settings: {e}")
-    
-    return {
-        'integrations': [],
-        'audit_log': []
-    }
+        return os.stat(SLACK_SETTINGS_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+def load_slack_settings():
+    """Load Slack integration settings, re-reading the file only when it has changed"""
+    global _slack_settings_cache, _slack_settings_mtime
+    with slack_settings_lock:
+        mtime = get_slack_settings_mtime()
+        if _slack_settings_cache is not None and mtime == _slack_settings_mtime:
+            return _slack_settings_cache
+        
+        settings = None
+        try:
+            if mtime is not None:
+                with open(SLACK_SETTINGS_FILE, 'rb') as f:
+                    settings = decode_json(f.read())
+        except Exception as e:
+            print(f"Error loading Slack settings: {e}")
+        
+        if settings is None:
+            settings = {
+                'integrations': []
+            }
+        _slack_settings_cache = settings
+        _slack_settings_mtime = mtime
+        return settings
+
+# Notification audit log: one JSON object per line, appended rather than rewritten per entry
+SLACK_AUDIT_LOG_FILE = 'slack_audit.jsonl'
+AUDIT_LOG_LIMIT = 100
+# The file is trimmed back to the newest AUDIT_LOG_LIMIT entries after this many appends
+AUDIT_LOG_COMPACT_EVERY = 1000
+# Entries are queued and written in batches of up to AUDIT_LOG_BATCH_SIZE, at most
+# AUDIT_LOG_FLUSH_INTERVAL seconds after the first one arrives
+AUDIT_LOG_BATCH_SIZE = 64
+AUDIT_LOG_FLUSH_INTERVAL = 0.05
+slack_audit_lock = Lock()
+audit_log_queue = Queue()
+_audit_appends_since_compact = 0
+_audit_log_migrated = False
+_audit_log_writer = None
+_audit_log_writer_lock = Lock()
+
+def append_audit_log(entry):
+    """Queue one entry for the background audit log writer"""
+    start_audit_log_writer()
+    audit_log_queue.put(entry)
+
+def start_audit_log_writer():
+    """Start the background writer the first time an entry is queued, and flush it at exit"""
+    global _audit_log_writer
+    if _audit_log_writer is not None:
+        return
+    with _audit_log_writer_lock:
+        if _audit_log_writer is None:
+            _audit_log_writer = Thread(target=run_audit_log_writer, name='slack-audit-writer', daemon=True)
+            _audit_log_writer.start()
+            atexit.register(flush_audit_log)
+
+def flush_audit_log(timeout=5):
+    """Stop the writer once it has written what it holds, then write anything still queued"""
+    if _audit_log_writer is not None:
+        audit_log_queue.put(None)
+        _audit_log_writer.join(timeout)
+    remaining = []
+    while True:
+        try:
+            entry = audit_log_queue.get_nowait()
+        except Empty:
+            break
+        if entry is not None:
+            remaining.append(entry)
+    if remaining:
+        write_audit_batch(remaining)
+
+def write_audit_batch(entries):
+    """Append a batch of entries to the audit log file in one write, compacting it now and then"""
+    global _audit_appends_since_compact, _audit_log_migrated
+    with slack_audit_lock:
+        if not _audit_log_migrated:
+            _audit_log_migrated = True
+            entries = legacy_audit_entries() + list(entries)
+        try:
+            with open(SLACK_AUDIT_LOG_FILE, 'ab') as f:
+                f.write(b''.join(encode_json(entry) + b'\n' for entry in entries))
+        except Exception as e:
+            print(f"Error writing Slack audit log: {e}")
+            return
+        
+        _audit_appends_since_compact += len(entries)
+        if _audit_appends_since_compact >= AUDIT_LOG_COMPACT_EVERY:
+            _audit_appends_since_compact = 0
+            compact_audit_log()
+
+def run_audit_log_writer():
+    """Drain the audit queue, writing whatever arrived within one flush interval together
+
+    A None in the queue stops the writer after the batch it is collecting has been written.
+    """
+    stopping = False
+    while not stopping:
+        entry = audit_log_queue.get()
+        if entry is None:
+            return
+        batch = [entry]
+        deadline = time.monotonic() + AUDIT_LOG_FLUSH_INTERVAL
+        while len(batch) < AUDIT_LOG_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                entry = audit_log_queue.get(timeout=remaining)
+            except Empty:
+                break
+            if entry is None:
+                stopping = True
+                break
+            batch.append(entry)
+        write_audit_batch(batch)
 
-def save_slack_settings(settings):
-    """Save Slack integration settings to file"""
-    settings_file = 'slack_settings.json'
+def compact_audit_log():
+    """Rewrite the audit log file with only its newest entries (caller holds slack_audit_lock)"""
+    temp_file = SLACK_AUDIT_LOG_FILE + '.tmp'
     try:
-        with open(settings_file, 'w') as f:
-            json.dump(settings, f, indent=2, default=str)
-        return True
+        with open(SLACK_AUDIT_LOG_FILE, 'rb') as f:
+            newest = deque(f, maxlen=AUDIT_LOG_LIMIT)
+        with open(temp_file, 'wb') as f:
+            f.writelines(newest)
+        os.replace(temp_file, SLACK_AUDIT_LOG_FILE)
     except Exception as e:
-        print(f"Error saving Slack settings: {e}")
-        return False
+        print(f"Error compacting Slack audit log: {e}")
+
+def legacy_audit_entries():
+    """Entries from the audit_log array older settings files carried, oldest first
+
+    Only returned while the JSONL log doesn't exist yet, so they are copied into it once, with
+    the first batch written.
+    """
+    if os.path.exists(SLACK_AUDIT_LOG_FILE):
+        return []
+    # The array was kept newest first; the log file is oldest first
+    return list(reversed(load_slack_settings().get('audit_log', [])[:AUDIT_LOG_LIMIT]))
+
+SLACK_WEBHOOK_PREFIX = 'https://hooks.slack.com/services/'
+# Prefix followed by the workspace id, the bot/channel id and the token: T.../B.../token
+SLACK_WEBHOOK_RE = re.compile(re.escape(SLACK_WEBHOOK_PREFIX) + r'T[A-Z0-9]+/B[A-Z0-9]+/[A-Za-z0-9]+')
 
 def validate_slack_webhook(webhook_url):
     """Validate if a Slack webhook URL is properly formatted"""
     if not webhook_url:
         return False, "Webhook URL is required"
     
-    if not webhook_url.startswith('https://hooks.slack.com/services/'):
+    if not webhook_url.startswith(SLACK_WEBHOOK_PREFIX):
         return False, "Invalid Slack webhook URL format. Must start with 'https://hooks.slack.com/services/'"
     
     # Basic format check for Slack webhook URL structure
-    parts = webhook_url.replace('https://hooks.slack.com/services/', '').split('/')
-    if len(parts) != 3:
+    if not SLACK_WEBHOOK_RE.fullmatch(webhook_url):
         return False, "Invalid webhook URL structure. Should be: https://hooks.slack.com/services/T.../B.../..."
     
     return True, "Valid webhook URL"
 
+# Pooled keep-alive session shared by webhook tests and notifications, so a connection test
+# leaves a warm connection behind; urllib3 retries throttled and failed deliveries with backoff
+SLACK_WEBHOOK_RETRIES = 2
+slack_webhook_session = requests.Session()
+slack_webhook_session.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=SLACK_WEBHOOK_RETRIES,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['POST']),
+        raise_on_status=False
+    )
+))
+
 def test_slack_webhook(webhook_url, channel_name):
     """Test a Slack webhook by sending a test message"""
     try:
@@ -1249,7 +1689,7 @@ def test_slack_webhook(webhook_url, channel_name):
         }
         
         print(f"Testing webhook: {webhook_url[:50]}...")
-        response = requests.post(webhook_url, json=message, timeout=15)
+        response = slack_webhook_session.post(webhook_url, data=encode_json(message), headers=JSON_HEADERS, timeout=15)
         
         print(f"Webhook response: {response.status_code} - {response.text[:200]}")
         
@@ -1271,140 +1711,138 @@ def test_slack_webhook(webhook_url, channel_name):
     except Exception as e:
         return False, f"Webhook test error: {str(e)}"
 
-def send_slack_notification(webhook_url, channel, search_data, posts, retry_count=0):
-    """Send a formatted notification to Slack about completed search"""
-    try:
-        # Calculate summary stats
-        total_posts = len(posts)
-        avg_score = sum(p.get('score', 0) for p in posts) / max(total_posts, 1)
-        total_comments = sum(p.get('num_comments', 0) for p in posts)
-        positive_posts = len([p for p in posts if p.get('sentiment') == 'positive'])
-        positive_pct = (positive_posts / total_posts * 100) if total_posts > 0 else 0
-        
-        # Get top 3 posts by engagement
-        top_posts = sorted(posts, key=lambda x: x.get('engagement_rate', 0), reverse=True)[:3]
-        
-        # Create download link (simplified for demo)
-        download_id = str(uuid4())[:8]
-        download_link = f"https://scrapper-eight-alpha.vercel.app/download/{download_id}"
-        
-        # Build Slack message
-        message = {
-            "channel": channel,
-            "username": "Reddit Scraper Pro",
-            "icon_emoji": ":mag:",
-            "text": f":chart_with_upwards_trend: *Reddit Search Complete!*",
-            "attachments": [
-                {
-                    "color": "good" if total_posts > 0 else "warning",
-                    "fields": [
-                        {
-                            "title": "Search Query",
-                            "value": search_data.get('keywords', 'N/A'),
-                            "short": True
-                        },
-                        {
-                            "title": "Subreddit(s)",
-                            "value": search_data.get('subreddit_display', 'all'),
-                            "short": True
-                        },
-                        {
-                            "title": "Posts Found",
-                            "value": f"{total_posts:,}",
-                            "short": True
-                        },
-                        {
-                            "title": "Avg Upvotes",
-                            "value": f"{avg_score:.1f}",
-                            "short": True
-                        },
-                        {
-                            "title": "Total Comments",
-                            "value": f"{total_comments:,}",
-                            "short": True
-                        },
-                        {
-                            "title": "Positive Sentiment",
-                            "value": f"{positive_pct:.1f}%",
-                            "short": True
-                        }
-                    ],
-                    "footer": "Reddit Scraper Pro",
-                    "footer_icon": "https://reddit.com/favicon.ico",
-                    "ts": int(time.time())
-                }
-            ]
-        }
-        
-        # Add top posts preview if available
-        if top_posts:
-            top_posts_text = "\n".join([
-                f"• <{post.get('url', '#')}|{post.get('title', 'Untitled')[:50]}...> ({post.get('score', 0)} upvotes)"
-                for post in top_posts
-            ])
-            
-            message["attachments"].append({
-                "color": "#1a73e8",
-                "title": ":fire: Top Engaging Posts",
-                "text": top_posts_text,
-                "mrkdwn_in": ["text"]
-            })
+def build_slack_notification(search_data, posts):
+    """Build the Slack message for a completed search, without the channel"""
+    # Calculate summary stats
+    total_posts = len(posts)
+    avg_score = sum(p.get('score', 0) for p in posts) / max(total_posts, 1)
+    total_comments = sum(p.get('num_comments', 0) for p in posts)
+    positive_posts = sum(1 for p in posts if p.get('sentiment') == 'positive')
+    positive_pct = (positive_posts / total_posts * 100) if total_posts > 0 else 0
+    
+    # Get top 3 posts by engagement
+    top_posts = heapq.nlargest(3, posts, key=lambda x: x.get('engagement_rate', 0))
+    
+    # Create download link (simplified for demo)
+    download_id = uuid4().hex[:8]
+    download_link = f"https://scrapper-eight-alpha.vercel.app/download/{download_id}"
+    
+    # Build Slack message
+    message = {
+        "username": "Reddit Scraper Pro",
+        "icon_emoji": ":mag:",
+        "text": f":chart_with_upwards_trend: *Reddit Search Complete!*",
+        "attachments": [
+            {
+                "color": "good" if total_posts > 0 else "warning",
+                "fields": [
+                    {
+                        "title": "Search Query",
+                        "value": search_data.get('keywords', 'N/A'),
+                        "short": True
+                    },
+                    {
+                        "title": "Subreddit(s)",
+                        "value": search_data.get('subreddit_display', 'all'),
+                        "short": True
+                    },
+                    {
+                        "title": "Posts Found",
+                        "value": f"{total_posts:,}",
+                        "short": True
+                    },
+                    {
+                        "title": "Avg Upvotes",
+                        "value": f"{avg_score:.1f}",
+                        "short": True
+                    },
+                    {
+                        "title": "Total Comments",
+                        "value": f"{total_comments:,}",
+                        "short": True
+                    },
+                    {
+                        "title": "Positive Sentiment",
+                        "value": f"{positive_pct:.1f}%",
+                        "short": True
+                    }
+                ],
+                "footer": "Reddit Scraper Pro",
+                "footer_icon": "https://reddit.com/favicon.ico",
+                "ts": int(time.time())
+            }
+        ]
+    }
+    
+    # Add top posts preview if available
+    if top_posts:
+        top_posts_text = "\n".join([
+            f"• <{post.get('url', '#')}|{post.get('title', 'Untitled')[:50]}...> ({post.get('score', 0)} upvotes)"
+            for post in top_posts
+        ])
         
-        # Add action buttons
         message["attachments"].append({
-            "color": "#0f9d58",
-            "actions": [
-                {
-                    "type": "button",
-                    "text": ":arrow_down: Download CSV",
-                    "url": download_link,
-                    "style": "primary"
-                },
-                {
-                    "type": "button",
-                    "text": ":mag: View Dashboard",
-                    "url": "https://scrapper-eight-alpha.vercel.app"
-                }
-            ]
+            "color": "#1a73e8",
+            "title": ":fire: Top Engaging Posts",
+            "text": top_posts_text,
+            "mrkdwn_in": ["text"]
         })
-        
-        response = requests.post(webhook_url, json=message, timeout=15)
+    
+    # Add action buttons
+    message["attachments"].append({
+        "color": "#0f9d58",
+        "actions": [
+            {
+                "type": "button",
+                "text": ":arrow_down: Download CSV",
+                "url": download_link,
+                "style": "primary"
+            },
+            {
+                "type": "button",
+                "text": ":mag: View Dashboard",
+                "url": "https://scrapper-eight-alpha.vercel.app"
+            }
+        ]
+    })
+    
+    return message
+
+def send_slack_notification(webhook_url, channel, message):
+    """Send a prebuilt search notification to one Slack channel"""
+    try:
+        payload = dict(message, channel=channel)
+        response = slack_webhook_session.post(webhook_url, data=encode_json(payload), headers=JSON_HEADERS, timeout=15)
         
         if response.status_code == 200:
             return True, "Notification sent successfully"
-        else:
-            if retry_count < 2:  # Retry up to 2 times
-                time.sleep(2 ** retry_count)  # Exponential backoff
-                return send_slack_notification(webhook_url, channel, search_data, posts, retry_count + 1)
-            return False, f"Failed after {retry_count + 1} attempts. Status: {response.status_code}"
+        return False, f"Failed with status {response.status_code}"
             
     except Exception as e:
-        if retry_count < 2:
-            time.sleep(2 ** retry_count)
-            return send_slack_notification(webhook_url, channel, search_data, posts, retry_count + 1)
-        return False, f"Error after {retry_count + 1} attempts: {str(e)}"
+        return False, f"Error sending notification: {str(e)}"
+
+def should_send_notification(integration, search_keywords, post_count):
+    """Check if notification should be sent based on settings
 
-def should_send_notification(integration, search_data, posts):
-    """Check if notification should be sent based on settings"""
+    search_keywords is the lowercased search query.
+    """
     # Check if integration is active
     if not integration.get('active', True):
         return False
     
-    # Check keyword filters
+    # Check keyword filters against the search query, lowercased once
     keyword_filters = integration.get('keyword_filters', [])
     if keyword_filters:
-        search_keywords = search_data.get('keywords', '').lower().split('\n')
-        if not any(kf.lower() in keyword for keyword in search_keywords for kf in keyword_filters):
+        if not any(kf.lower() in search_keywords for kf in keyword_filters):
             return False
     
     # Check minimum post count
     min_posts = integration.get('min_posts', 0)
-    if len(posts) < min_posts:
+    if post_count < min_posts:
         return False
     
     # Check severity level
     severity = integration.get('severity_level', 'info')
-    post_count = len(posts)
     
     if severity == 'alert' and post_count < 100:
         return False
@@ -1416,7 +1854,6 @@ def should_send_notification(integration, search_data, posts):
 
 def log_notification_attempt(integration_id, success, message, search_data):
     """Log notification attempt for audit purposes"""
-    settings = load_slack_settings()
     log_entry = {
         'id': str(uuid4()),
         'integration_id': integration_id,
@@ -1427,38 +1864,65 @@ def log_notification_attempt(integration_id, success, message, search_data):
         'subreddit': search_data.get('subreddit_display', 'N/A')
     }
     
-    settings['audit_log'].insert(0, log_entry)
-    # Keep only last 100 log entries
-    settings['audit_log'] = settings['audit_log'][:100]
-    save_slack_settings(settings)
+    append_audit_log(log_entry)
+
+# Integrations are notified in parallel, so one slow webhook doesn't hold up the rest
+slack_notification_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='slack-notify')
+
+def notify_integration(integration, search_data, message):
+    """Send and log the notification for one integration"""
+    try:
+        success, result = send_slack_notification(
+            integration['webhook_url'],
+            integration['channel'],
+            message
+        )
+        log_notification_attempt(integration['id'], success, result, search_data)
+            
+    except Exception as e:
+        log_notification_attempt(
+            integration.get('id', 'unknown'),
+            False,
+            f"Exception: {str(e)}",
+            search_data
+        )
+
+def get_notifiable_integrations():
+    """Active integrations with a well-formed webhook URL, rebuilt only when the settings change"""
+    global _notifiable_integrations
+    with slack_settings_lock:
+        settings = load_slack_settings()
+        source, integrations = _notifiable_integrations
+        if source is not settings:
+            integrations = [
+                integration for integration in settings.get('integrations', [])
+                if integration.get('active', True) and validate_slack_webhook(integration.get('webhook_url'))[0]
+            ]
+            _notifiable_integrations = (settings, integrations)
+        return integrations
 
 def process_slack_notifications(search_data, posts):
     """Process all Slack integrations for a completed search"""
-    def send_notifications():
-        settings = load_slack_settings()
-        integrations = settings.get('integrations', [])
-        
+    search_keywords = search_data.get('keywords', '').lower()
+    post_count = len(posts)
+    integrations = [
+        integration for integration in get_notifiable_integrations()
+        if should_send_notification(integration, search_keywords, post_count)
+    ]
+    if not integrations:
+        return
+    
+    # The summary message is the same for every integration, so build it once
+    try:
+        message = build_slack_notification(search_data, posts)
+    except Exception as e:
         for integration in integrations:
-            try:
-                if should_send_notification(integration, search_data, posts):
-                    success, message = send_slack_notification(
-                        integration['webhook_url'],
-                        integration['channel'],
-                        search_data,
-                        posts
-                    )
-                    log_notification_attempt(integration['id'], success, message, search_data)
-                    
-            except Exception as e:
-                log_notification_attempt(
-                    integration.get('id', 'unknown'),
-                    False,
-                    f"Exception: {str(e)}",
-                    search_data
-                )
+            log_notification_attempt(integration.get('id', 'unknown'), False, f"Exception: {str(e)}", search_data)
+        return
     
-    # Send notifications in background thread
-    Thread(target=send_notifications, daemon=True).start()
+    # Send notifications in the background
+    for integration in integrations:
+        slack_notification_pool.submit(notify_integration, integration, search_data, message)
 
 @app.route('/')
 def index():
@@ -1527,6 +1991,10 @@ def index():
         .data-table tr:hover { background: #f8f9fa; }
         .data-table a { color: #1a73e8; text-decoration: none; }
         .data-table a:hover { text-decoration: underline; }
+        .virtual-scroll { height: 460px; overflow-y: auto; }
+        .virtual-scroll .data-table { margin: 0; }
+        .virtual-scroll .data-table td { height: 46px; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+        .virtual-scroll .data-table td.spacer { height: auto; padding: 0; border: none; }
         
         .download-btn { background: #0f9d58; color: white; padding: 15px 30px; border: none; 
                        border-radius: 6px; font-size: 16px; font-weight: bold; cursor: pointer; 
@@ -1703,8 +2171,8 @@ def index():
                 </div>
                 
                 <div class="tabs">
-                    <button class="tab active" onclick="showTab('engagement')">🚀 Engagement</button>
-                    <button class="tab" onclick="showTab('data')">📋 Data Preview</button>
+                    <button class="tab active" data-tab="engagement" onclick="showTab('engagement', this)">🚀 Engagement</button>
+                    <button class="tab" data-tab="data" onclick="showTab('data', this)">📋 Data Preview</button>
                 </div>
                 
                 <div id="tab-engagement" class="tab-content active">
@@ -1831,31 +2299,71 @@ def index():
         </div>
     </div>
     
+    <!-- Row skeletons cloned by the discover modal -->
+    <template id="tplSubredditRow">
+        <div class="subreddit-item">
+            <div class="subreddit-info">
+                <div class="subreddit-name" data-field="name"></div>
+                <div class="subreddit-stats" data-field="stats"></div>
+                <div class="subreddit-description" data-field="description"></div>
+            </div>
+            <button class="add-btn" data-action="toggle"></button>
+        </div>
+    </template>
+    
+    <template id="tplSelectedItem">
+        <div class="selected-item">
+            <span class="selected-name"></span>
+            <button class="remove-btn" data-action="remove" title="Remove">×</button>
+        </div>
+    </template>
+    
     <script>
-        console.log('=== JavaScript Loading Started - v2.1 ===');
-        console.log('Document ready state:', document.readyState);
-        console.log('Deployment time: 2025-09-20 21:13 UTC');
+        // Debug logging is compiled out unless DEBUG is flipped on
+        const DEBUG = false;
+        const log = DEBUG ? console.log.bind(console) : () => {};
+        
+        log('=== JavaScript Loading Started - v2.1 ===');
+        log('Document ready state:', document.readyState);
+        log('Deployment time: 2025-09-20 21:13 UTC');
         
         let searchResults = null;
         let searchQuery = '';
-        
-        // Tab functionality
-        function showTab(tabName) {
-            document.querySelectorAll('.tab-content').forEach(tab => tab.classList.remove('active'));
-            document.querySelectorAll('.tab').forEach(tab => tab.classList.remove('active'));
-            document.getElementById(`tab-${tabName}`).classList.add('active');
-            event.target.classList.add('active');
+
+        // Static element references, looked up once (this script runs after the markup above)
+        const dom = {};
+        for (const id of ['searchForm', 'loading', 'results', 'metrics', 'engagementContent', 'dataContent',
+                          'downloadSection', 'downloadBtn', 'slackModal', 'discoverModal', 'modalLoading',
+                          'modalResults', 'modalResultsList', 'modalSearchInput', 'selectedSubreddits',
+                          'selectedList', 'subreddit', 'keywords', 'tplSubredditRow', 'tplSelectedItem']) {
+            dom[id] = document.getElementById(id);
+        }
+
+        // Tab functionality: panels are indexed once and only the outgoing/incoming pair is touched
+        const tabPanels = new Map(Array.from(document.querySelectorAll('.tab-content'), panel => [panel.id.replace('tab-', ''), panel]));
+        let activeTab = document.querySelector('.tab.active');
+        let activePanel = document.querySelector('.tab-content.active');
+        
+        function showTab(tabName, tabButton) {
+            activeTab.classList.remove('active');
+            activePanel.classList.remove('active');
+            activeTab = tabButton;
+            activePanel = tabPanels.get(tabName);
+            activeTab.classList.add('active');
+            activePanel.classList.add('active');
         }
         
         // Form submission
-        document.getElementById('searchForm').addEventListener('submit', async function(e) {
+        dom.searchForm.addEventListener('submit', async function(e) {
             e.preventDefault();
             
-            const loading = document.getElementById('loading');
-            const results = document.getElementById('results');
+            const loading = dom.loading;
+            const results = dom.results;
             
             loading.style.display = 'block';
             results.style.display = 'none';
+            // A new search starts its table at the top
+            dom.dataContent.innerHTML = '';
             
             const formData = new FormData(this);
             const params = new URLSearchParams(formData);
@@ -1867,23 +2375,24 @@ def index():
             params.set('sentiment_filter', 'all');
             
             try {
-                const keywords = document.getElementById('keywords').value.trim();
+                const keywords = dom.keywords.value.trim();
                 if (!keywords) {
                     loading.style.display = 'none';
                     showAlert('error', 'Please enter at least one keyword.');
                     return;
                 }
                 
+                params.set('format', 'ndjson');
                 const response = await fetch('/api/advanced_search?' + params.toString());
-                const data = await response.json();
+                const data = await readSearchStream(response);
                 
                 loading.style.display = 'none';
                 
                 if (data.success) {
                     searchResults = data.posts;
                     searchQuery = data.search_query;
-                    displayResults(data);
                     results.style.display = 'block';
+                    displayResults(data);
                 } else {
                     showAlert('error', `Error: ${data.error}`);
                 }
@@ -1893,16 +2402,65 @@ def index():
             }
         });
         
+        // Consume the NDJSON search stream, rendering partial results every 50 posts
+        async function readSearchStream(response) {
+            // Validation errors are returned as a plain JSON document
+            if (!(response.headers.get('Content-Type') || '').includes('application/x-ndjson')) {
+                return response.json();
+            }
+            
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            const posts = [];
+            let buffer = '';
+            let summary = { success: false, error: 'Search ended unexpectedly' };
+            let renderedCount = 0;
+            
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, { stream: true });
+                const lines = buffer.split('\\n');
+                buffer = lines.pop();
+                
+                for (const line of lines) {
+                    if (!line) continue;
+                    const message = JSON.parse(line);
+                    if (message.type === 'post') {
+                        posts.push(message.post);
+                    } else {
+                        summary = message;
+                    }
+                }
+                
+                if (posts.length - renderedCount >= 50) {
+                    displayPartialResults(posts);
+                    renderedCount = posts.length;
+                }
+            }
+            
+            return { ...summary, posts };
+        }
+        
+        // Render whatever has streamed in so far; the final summary re-renders everything
+        function displayPartialResults(posts) {
+            // Shown first so the data table can measure its rows
+            dom.results.style.display = 'block';
+            displayMetrics({ posts, total_posts: posts.length });
+            displayEngagement(posts);
+            displayData(posts);
+        }
+        
         function displayResults(data) {
             displayMetrics(data);
             displayEngagement(data.posts);
             displayData(data.posts);
             
             // Show download section and attach event listener
-            const downloadSection = document.getElementById('downloadSection');
+            const downloadSection = dom.downloadSection;
             if (downloadSection) {
                 downloadSection.style.display = 'block';
-                const downloadBtn = document.getElementById('downloadBtn');
+                const downloadBtn = dom.downloadBtn;
                 if (downloadBtn) {
                     downloadBtn.onclick = function() {
                         if (searchResults) {
@@ -1917,7 +2475,7 @@ def index():
         }
         
         function displayMetrics(data) {
-            const metrics = document.getElementById('metrics');
+            const metrics = dom.metrics;
             const posts = data.posts;
             
             if (posts.length === 0) {
@@ -1954,9 +2512,31 @@ def index():
             `;
         }
         
+        // Escape server-provided text before it is interpolated into markup
+        const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+        function escapeHtml(value) {
+            return String(value ?? '').replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
+        }
+        
+        // Top-K selection in a single pass without sorting (or mutating) the input
+        function topK(arr, k, keyFn) {
+            const top = [];
+            for (const item of arr) {
+                const key = keyFn(item);
+                if (top.length === k && key <= keyFn(top[k - 1])) continue;
+                let i = top.length < k ? top.length : k - 1;
+                while (i > 0 && keyFn(top[i - 1]) < key) {
+                    top[i] = top[i - 1];
+                    i--;
+                }
+                top[i] = item;
+            }
+            return top;
+        }
+
         function displayEngagement(posts) {
-            const topEngaging = posts.sort((a, b) => b.engagement_rate - a.engagement_rate).slice(0, 10);
-            const engagementContent = document.getElementById('engagementContent');
+            const topEngaging = topK(posts, 10, p => p.engagement_rate);
+            const engagementContent = dom.engagementContent;
             
             engagementContent.innerHTML = `
                 <h4>🔥 Most Engaging Posts</h4>
@@ -1967,11 +2547,11 @@ def index():
                     <tbody>
                         ${topEngaging.map(p => `
                             <tr>
-                                <td><a href="${p.url}" target="_blank">${p.title.substring(0, 60)}...</a></td>
+                                <td><a href="${escapeHtml(p.url)}" target="_blank">${escapeHtml(p.title.substring(0, 60))}...</a></td>
                                 <td>${p.engagement_rate.toFixed(2)}%</td>
                                 <td>${p.score}</td>
                                 <td>${p.num_comments}</td>
-                                <td>r/${p.subreddit}</td>
+                                <td>r/${escapeHtml(p.subreddit)}</td>
                             </tr>
                         `).join('')}
                     </tbody>
@@ -1979,48 +2559,139 @@ def index():
             `;
         }
         
+        const SENTIMENT_COLORS = { positive: '#0f9d58', negative: '#ea4335' };
+        // Starting guess only: cell padding and borders make real rows taller, so the height
+        // is measured from the first rendered row
+        const VIRTUAL_ROW_HEIGHT = 46;
+        const VIRTUAL_VIEWPORT_HEIGHT = 460;
+        const VIRTUAL_BUFFER_ROWS = 5;
+        
+        // Render only the rows scrolled into view, recycling a fixed pool of <tr> nodes
+        function renderVirtualRows(scroller, tbody, items, columns, createRow, fillRow, scrollTop = 0) {
+            const topSpacer = document.createElement('tr');
+            const bottomSpacer = document.createElement('tr');
+            topSpacer.innerHTML = bottomSpacer.innerHTML = `<td class="spacer" colspan="${columns}"></td>`;
+            const pool = [];
+            let framePending = false;
+            let rowHeight = VIRTUAL_ROW_HEIGHT;
+            let measured = false;
+            
+            function render() {
+                framePending = false;
+                const viewportRows = Math.ceil((scroller.clientHeight || VIRTUAL_VIEWPORT_HEIGHT) / rowHeight);
+                const first = Math.max(0, Math.floor(scroller.scrollTop / rowHeight) - VIRTUAL_BUFFER_ROWS);
+                const last = Math.min(items.length, first + viewportRows + VIRTUAL_BUFFER_ROWS * 2);
+                while (pool.length < last - first) pool.push(createRow());
+                
+                topSpacer.firstChild.style.height = `${first * rowHeight}px`;
+                bottomSpacer.firstChild.style.height = `${(items.length - last) * rowHeight}px`;
+                
+                const fragment = document.createDocumentFragment();
+                fragment.appendChild(topSpacer);
+                for (let i = first; i < last; i++) {
+                    const row = pool[i - first];
+                    fillRow(row, items[i]);
+                    fragment.appendChild(row);
+                }
+                fragment.appendChild(bottomSpacer);
+                tbody.replaceChildren(fragment);
+                
+                // Hidden tables measure 0, so keep the guess until the rows are actually laid out
+                if (!measured && last > first) {
+                    const height = pool[0].getBoundingClientRect().height;
+                    if (height > 0) {
+                        measured = true;
+                        if (height !== rowHeight) {
+                            rowHeight = height;
+                            render();
+                        }
+                    }
+                }
+            }
+            
+            scroller.onscroll = () => {
+                if (framePending) return;
+                framePending = true;
+                requestAnimationFrame(render);
+            };
+            render();
+            // The spacers give the table its full height, so the previous position can be restored
+            if (scrollTop) {
+                scroller.scrollTop = scrollTop;
+                render();
+            }
+        }
+        
+        function createDataRow() {
+            const row = document.createElement('tr');
+            row.innerHTML = '<td><a target="_blank"></a></td><td></td><td></td><td></td><td></td><td></td>';
+            return row;
+        }
+        
+        function fillDataRow(row, p) {
+            const [title, subreddit, score, comments, sentiment, date] = row.cells;
+            title.firstChild.href = p.url;
+            title.firstChild.textContent = `${p.title.substring(0, 50)}...`;
+            subreddit.textContent = `r/${p.subreddit}`;
+            score.textContent = p.score;
+            comments.textContent = p.num_comments;
+            sentiment.textContent = p.sentiment;
+            sentiment.style.color = SENTIMENT_COLORS[p.sentiment] || '#9aa0a6';
+            date.textContent = p.date;
+        }
+        
         function displayData(posts) {
-            const dataContent = document.getElementById('dataContent');
+            const dataContent = dom.dataContent;
+            // Partial renders rebuild the table while the user may be scrolling it
+            const previous = dataContent.querySelector('.virtual-scroll');
+            const scrollTop = previous ? previous.scrollTop : 0;
             dataContent.innerHTML = `
-                <p><strong>Showing first 20 posts</strong> (download Excel for complete data)</p>
-                <table class="data-table">
-                    <thead>
-                        <tr><th>Title</th><th>Subreddit</th><th>Upvotes</th><th>Comments</th><th>Sentiment</th><th>Date</th></tr>
-                    </thead>
-                    <tbody>
-                        ${posts.slice(0, 20).map(p => `
-                            <tr>
-                                <td><a href="${p.url}" target="_blank">${p.title.substring(0, 50)}...</a></td>
-                                <td>r/${p.subreddit}</td>
-                                <td>${p.score}</td>
-                                <td>${p.num_comments}</td>
-                                <td style="color: ${p.sentiment === 'positive' ? '#0f9d58' : p.sentiment === 'negative' ? '#ea4335' : '#9aa0a6'}">${p.sentiment}</td>
-                                <td>${p.date}</td>
-                            </tr>
-                        `).join('')}
-                    </tbody>
-                </table>
+                <p><strong>Showing all ${posts.length} posts</strong> (download Excel for full post details)</p>
+                <div class="virtual-scroll">
+                    <table class="data-table">
+                        <thead>
+                            <tr><th>Title</th><th>Subreddit</th><th>Upvotes</th><th>Comments</th><th>Sentiment</th><th>Date</th></tr>
+                        </thead>
+                        <tbody></tbody>
+                    </table>
+                </div>
             `;
+            renderVirtualRows(dataContent.querySelector('.virtual-scroll'), dataContent.querySelector('tbody'),
+                              posts, 6, createDataRow, fillDataRow, scrollTop);
         }
         
-        function downloadExcel(posts, query) {
-            const form = document.createElement('form');
-            form.method = 'POST';
-            form.action = '/download_excel';
-            const input = document.createElement('input');
-            input.type = 'hidden';
-            input.name = 'data';
-            input.value = JSON.stringify({posts, query});
-            form.appendChild(input);
-            document.body.appendChild(form);
-            form.submit();
-            document.body.removeChild(form);
+        async function downloadExcel(posts, query) {
+            try {
+                const response = await fetch('/download_excel', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({posts, query})
+                });
+                
+                // Failures come back as a JSON error document rather than a workbook
+                if ((response.headers.get('Content-Type') || '').includes('application/json')) {
+                    const data = await response.json();
+                    showAlert('error', `Download failed: ${data.error}`);
+                    return;
+                }
+                
+                const disposition = response.headers.get('Content-Disposition') || '';
+                const match = disposition.match(/filename="?([^";]+)"?/);
+                const link = document.createElement('a');
+                link.href = URL.createObjectURL(await response.blob());
+                link.download = match ? match[1] : `${query}.xlsx`;
+                link.click();
+                // Give the browser a moment to start the download before releasing the blob
+                setTimeout(() => URL.revokeObjectURL(link.href), 1000);
+            } catch (error) {
+                showAlert('error', `Download failed: ${error.message}`);
+            }
         }
         
         function showAlert(type, message) {
             const alert = document.createElement('div');
             alert.className = `alert ${type}`;
-            alert.innerHTML = message;
+            alert.textContent = message;
             document.querySelector('.container').insertBefore(alert, document.querySelector('.search-card'));
             setTimeout(() => alert.remove(), 5000);
         }
@@ -2028,11 +2699,11 @@ def index():
         // ============ UNIVERSAL SLACK APP INTEGRATION ============
         
         function openSlackModal() {
-            document.getElementById('slackModal').style.display = 'block';
+            dom.slackModal.style.display = 'block';
         }
         
         function closeSlackModal() {
-            document.getElementById('slackModal').style.display = 'none';
+            dom.slackModal.style.display = 'none';
         }
         
         // ============ DISCOVER SUBREDDITS FUNCTIONS ============
@@ -2040,20 +2711,20 @@ def index():
         let selectedSubreddits = new Set();
         
         function openDiscoverModal() {
-            document.getElementById('discoverModal').style.display = 'block';
-            document.getElementById('modalSearchInput').focus();
+            dom.discoverModal.style.display = 'block';
+            dom.modalSearchInput.focus();
             loadExistingSubreddits();
         }
         
         function closeDiscoverModal() {
-            document.getElementById('discoverModal').style.display = 'none';
-            document.getElementById('modalResults').style.display = 'none';
-            document.getElementById('modalLoading').style.display = 'none';
-            document.getElementById('modalSearchInput').value = '';
+            dom.discoverModal.style.display = 'none';
+            dom.modalResults.style.display = 'none';
+            dom.modalLoading.style.display = 'none';
+            dom.modalSearchInput.value = '';
         }
         
         function loadExistingSubreddits() {
-            const currentValue = document.getElementById('subreddit').value.trim();
+            const currentValue = dom.subreddit.value.trim();
             selectedSubreddits.clear();
             
             if (currentValue && currentValue.toLowerCase() !== 'all') {
@@ -2069,9 +2740,23 @@ def index():
         let isLoading = false;
         let hasMore = true;
         let currentSearchTerm = '';
+        let currentSearchAbort = null;
+        
+        // Delay fn until calls stop arriving for `ms` milliseconds; .cancel() drops a pending call
+        function debounce(fn, ms) {
+            let timer;
+            const debounced = (...args) => {
+                clearTimeout(timer);
+                timer = setTimeout(() => fn(...args), ms);
+            };
+            debounced.cancel = () => clearTimeout(timer);
+            return debounced;
+        }
         
         async function searchSubredditsInModal(reset = true) {
-            const searchTerm = document.getElementById('modalSearchInput').value.trim();
+            // Enter and the search button run right away, so a pending as-you-type search is redundant
+            debouncedSearch.cancel();
+            const searchTerm = dom.modalSearchInput.value.trim();
             if (!searchTerm) {
                 showAlert('error', 'Please enter a search term to find subreddits.');
                 return;
@@ -2084,88 +2769,116 @@ def index():
                 currentSearchTerm = searchTerm;
             }
             
+            // A new search supersedes whatever request is still in flight
+            if (reset && currentSearchAbort) {
+                currentSearchAbort.abort();
+                isLoading = false;
+            }
+            
             if (isLoading || !hasMore) return;
             
-            const loading = document.getElementById('modalLoading');
-            const results = document.getElementById('modalResults');
-            const resultsList = document.getElementById('modalResultsList');
+            currentSearchAbort = new AbortController();
+            const { signal } = currentSearchAbort;
+            
+            const loading = dom.modalLoading;
+            const results = dom.modalResults;
+            const resultsList = dom.modalResultsList;
             
             isLoading = true;
             loading.style.display = 'block';
             
-            if (reset) {
-                results.style.display = 'none';
-                resultsList.innerHTML = '';
-            }
-            
             try {
-                const response = await fetch(`/api/discover_subreddits?search=${encodeURIComponent(searchTerm)}&page=${currentPage}&limit=20`);
+                const response = await fetch(`/api/discover_subreddits?search=${encodeURIComponent(searchTerm)}&page=${currentPage}&limit=20`, { signal });
                 const data = await response.json();
                 
-                loading.style.display = 'none';
                 isLoading = false;
                 
-                if (data.success && data.subreddits.length > 0) {
-                    const newItems = data.subreddits.map(sub => {
-                        const isSelected = selectedSubreddits.has(sub.name);
-                        return `
-                            <div class="subreddit-item" data-subreddit="${sub.name}">
-                                <div class="subreddit-info">
-                                    <div class="subreddit-name">r/${sub.name}</div>
-                                    <div class="subreddit-stats">${sub.subscribers.toLocaleString()} members</div>
-                                    <div class="subreddit-description">${sub.description || sub.title}</div>
-                                </div>
-                                <button class="add-btn" onclick="toggleSubreddit('${sub.name}')" ${isSelected ? 'disabled' : ''}>
-                                    ${isSelected ? '✓ Added' : '+ Add'}
-                                </button>
-                            </div>
-                        `;
-                    }).join('');
+                if (!data.success || data.subreddits.length === 0) {
+                    requestAnimationFrame(() => {
+                        if (signal.aborted) return;
+                        loading.style.display = 'none';
+                        if (reset) {
+                            resultsList.innerHTML = '<p style="text-align: center; color: #666; padding: 20px;">No subreddits found. Try a different search term.</p>';
+                            results.style.display = 'block';
+                        }
+                    });
+                    return;
+                }
+                
+                const newItems = document.createDocumentFragment();
+                for (const sub of data.subreddits) {
+                    newItems.appendChild(buildSubredditRow(sub));
+                }
+                
+                // Update pagination state
+                hasMore = data.has_more;
+                currentPage++;
+                
+                // Markup is built off-DOM above; apply every DOM write in one frame
+                requestAnimationFrame(() => {
+                    if (signal.aborted) return;
+                    loading.style.display = 'none';
                     
                     if (reset) {
-                        resultsList.innerHTML = newItems;
+                        resultsList.replaceChildren(newItems);
                     } else {
-                        resultsList.innerHTML += newItems;
+                        resultsList.appendChild(newItems);
                     }
                     
-                    // Update pagination state
-                    hasMore = data.has_more;
-                    currentPage++;
-                    
                     // Add load more button if there are more results
                     updateLoadMoreButton(data);
                     
-                    results.style.display = 'block';
-                    
                     // Show search summary
                     if (reset) {
                         showSearchSummary(data);
                     }
-                } else if (reset) {
-                    resultsList.innerHTML = '<p style="text-align: center; color: #666; padding: 20px;">No subreddits found. Try a different search term.</p>';
+                    
                     results.style.display = 'block';
-                }
+                });
             } catch (error) {
+                if (error.name === 'AbortError') return;
                 loading.style.display = 'none';
                 isLoading = false;
                 showAlert('error', `Search failed: ${error.message}`);
             }
         }
         
+        // Clone the prebuilt row skeleton and fill it via textContent (no HTML parsing per row)
+        function buildSubredditRow(sub) {
+            const row = dom.tplSubredditRow.content.firstElementChild.cloneNode(true);
+            const isSelected = selectedSubreddits.has(sub.name);
+            row.dataset.subreddit = sub.name;
+            row.querySelector('[data-field="name"]').textContent = `r/${sub.name}`;
+            row.querySelector('[data-field="stats"]').textContent = `${sub.subscribers.toLocaleString()} members`;
+            row.querySelector('[data-field="description"]').textContent = sub.description || sub.title;
+            const btn = row.querySelector('.add-btn');
+            btn.dataset.sub = sub.name;
+            btn.disabled = isSelected;
+            btn.textContent = isSelected ? '✓ Added' : '+ Add';
+            return row;
+        }
+        
+        const debouncedSearch = debounce(searchSubredditsInModal, 250);
+        
+        // Search as the user types, once they pause
+        dom.modalSearchInput.addEventListener('input', () => {
+            if (dom.modalSearchInput.value.trim()) debouncedSearch();
+        });
+        
         function showSearchSummary(data) {
             const summaryHtml = `
                 <div class="search-summary" style="background: #e3f2fd; padding: 15px; border-radius: 8px; margin-bottom: 15px; border-left: 4px solid #1a73e8;">
-                    <strong>🔍 Search Results for "${data.search_term}"</strong><br>
+                    <strong>🔍 Search Results for "${escapeHtml(data.search_term)}"</strong><br>
                     <span style="color: #666; font-size: 14px;">Found ${data.total_found}+ communities • Page ${data.page - 1} • ${data.has_more ? 'More available' : 'All results shown'}</span>
                 </div>
             `;
             
-            const resultsList = document.getElementById('modalResultsList');
+            const resultsList = dom.modalResultsList;
             resultsList.insertAdjacentHTML('afterbegin', summaryHtml);
         }
         
         function updateLoadMoreButton(data) {
-            const resultsList = document.getElementById('modalResultsList');
+            const resultsList = dom.modalResultsList;
             
             // Remove existing load more button
             const existingBtn = document.getElementById('loadMoreBtn');
@@ -2175,7 +2888,7 @@ def index():
             if (data.has_more) {
                 const loadMoreBtn = `
                     <div id="loadMoreBtn" style="text-align: center; padding: 20px;">
-                        <button onclick="searchSubredditsInModal(false)" 
+                        <button data-action="load-more" 
                                 style="background: #1a73e8; color: white; border: none; padding: 12px 24px; border-radius: 6px; cursor: pointer; font-size: 14px;">
                             🔄 Load More Results (${currentPage - 1} of many)
                         </button>
@@ -2195,38 +2908,66 @@ def index():
         
         function toggleSubreddit(subredditName) {
             if (selectedSubreddits.has(subredditName)) {
-                selectedSubreddits.delete(subredditName);
-            } else {
-                selectedSubreddits.add(subredditName);
+                removeSelectedSubreddit(subredditName);
+                return;
             }
-            updateSelectedDisplay();
-            searchSubredditsInModal(); // Refresh results to update buttons
+            selectedSubreddits.add(subredditName);
+            dom.selectedList.appendChild(buildSelectedItem(subredditName));
+            updateSelectedVisibility();
+            updateAddButton(subredditName);
         }
         
         function removeSelectedSubreddit(subredditName) {
             selectedSubreddits.delete(subredditName);
-            updateSelectedDisplay();
+            const item = dom.selectedList.querySelector(`.selected-item[data-sub="${CSS.escape(subredditName)}"]`);
+            if (item) item.remove();
+            updateSelectedVisibility();
+            updateAddButton(subredditName);
+        }
+        
+        // Patch the one affected result button instead of re-running the search
+        function updateAddButton(subredditName) {
+            const btn = dom.modalResultsList.querySelector(`[data-action="toggle"][data-sub="${CSS.escape(subredditName)}"]`);
+            if (!btn) return;
+            const isSelected = selectedSubreddits.has(subredditName);
+            btn.disabled = isSelected;
+            btn.textContent = isSelected ? '✓ Added' : '+ Add';
         }
         
+        function buildSelectedItem(sub) {
+            const item = dom.tplSelectedItem.content.firstElementChild.cloneNode(true);
+            item.dataset.sub = sub;
+            item.querySelector('.selected-name').textContent = `r/${sub}`;
+            item.querySelector('.remove-btn').dataset.sub = sub;
+            return item;
+        }
+        
+        function updateSelectedVisibility() {
+            dom.selectedSubreddits.style.display = selectedSubreddits.size > 0 ? 'block' : 'none';
+        }
+        
+        // Full rebuild, only needed when the selection is reloaded from the subreddit field;
+        // individual adds/removes patch the list incrementally
         function updateSelectedDisplay() {
-            const selectedSection = document.getElementById('selectedSubreddits');
-            const selectedList = document.getElementById('selectedList');
-            
-            if (selectedSubreddits.size > 0) {
-                selectedList.innerHTML = Array.from(selectedSubreddits).map(sub => `
-                    <div class="selected-item">
-                        <span class="selected-name">r/${sub}</span>
-                        <button class="remove-btn" onclick="removeSelectedSubreddit('${sub}')" title="Remove">×</button>
-                    </div>
-                `).join('');
-                selectedSection.style.display = 'block';
-            } else {
-                selectedSection.style.display = 'none';
-            }
+            dom.selectedList.replaceChildren(...Array.from(selectedSubreddits, buildSelectedItem));
+            updateSelectedVisibility();
         }
         
+        // One delegated click listener per list instead of inline handlers on every row
+        dom.modalResultsList.addEventListener('click', e => {
+            const btn = e.target.closest('button[data-action]');
+            if (!btn) return;
+            if (btn.dataset.action === 'toggle') toggleSubreddit(btn.dataset.sub);
+            else if (btn.dataset.action === 'load-more') searchSubredditsInModal(false);
+        });
+        
+        dom.selectedList.addEventListener('click', e => {
+            const btn = e.target.closest('button[data-action="remove"]');
+            if (btn) removeSelectedSubreddit(btn.dataset.sub);
+        });
+        
         function applySelectedSubreddits() {
-            const subredditInput = document.getElementById('subreddit');
+            const subredditInput = dom.subreddit;
             
             if (selectedSubreddits.size > 0) {
                 subredditInput.value = Array.from(selectedSubreddits).join(',');
@@ -2241,8 +2982,8 @@ def index():
         
         // Close modals when clicking outside
         window.onclick = function(event) {
-            const discoverModal = document.getElementById('discoverModal');
-            const slackModal = document.getElementById('slackModal');
+            const discoverModal = dom.discoverModal;
+            const slackModal = dom.slackModal;
             if (event.target === discoverModal) {
                 closeDiscoverModal();
             } else if (event.target === slackModal) {
@@ -2277,77 +3018,15 @@ def discover_subreddits():
                 'has_more': page < 3  # Mock has 3 pages
             })
         
-        discovered_subreddits = set()
-        
+        # Reuse the full result list for follow-up pages of the same search
+        cache_key = search_term.lower()
         try:
-            # Search for subreddits by name - get more results
-            subreddit_results = reddit.subreddits.search_by_name(search_term, exact=False)
-            
-            # Also search subreddit content for broader results
-            try:
-                content_results = reddit.subreddit('all').search(f'subreddit:{search_term}', limit=50)
-                additional_subreddits = set()
-                for post in content_results:
-                    try:
-                        sub_name = post.subreddit.display_name.lower()
-                        if search_term.lower() in sub_name:
-                            additional_subreddits.add(post.subreddit.display_name)
-                        if len(additional_subreddits) >= 25:
-                            break
-                    except:
-                        continue
-                
-                # Add found subreddits to search results
-                for sub_name in additional_subreddits:
-                    try:
-                        sub = reddit.subreddit(sub_name)
-                        if len(discovered_subreddits) >= 100:  # Increased limit
-                            break
-                        
-                        sub_info = {
-                            'name': sub.display_name,
-                            'title': sub.title[:100] if hasattr(sub, 'title') and sub.title else sub.display_name,
-                            'description': (sub.public_description or '')[:300] if hasattr(sub, 'public_description') else '',
-                            'subscribers': getattr(sub, 'subscribers', 0) or 0,
-                            'url': f'https://reddit.com/r/{sub.display_name}'
-                        }
-                        if sub_info['subscribers'] > 100:  # Only active subreddits
-                            discovered_subreddits.add(json.dumps(sub_info, sort_keys=True))
-                    except:
-                        continue
-            except:
-                pass
-            
-            # Process direct name search results
-            for sub in subreddit_results:
-                if len(discovered_subreddits) >= 100:  # Increased limit
-                    break
-                try:
-                    # Get subreddit info
-                    sub_info = {
-                        'name': sub.display_name,
-                        'title': sub.title[:100] if hasattr(sub, 'title') and sub.title else sub.display_name,
-                        'description': (sub.public_description or '')[:300] if hasattr(sub, 'public_description') else '',
-                        'subscribers': getattr(sub, 'subscribers', 0) or 0,
-                        'url': f'https://reddit.com/r/{sub.display_name}'
-                    }
-                    if sub_info['subscribers'] > 100:  # Only include active subreddits
-                        discovered_subreddits.add(json.dumps(sub_info, sort_keys=True))
-                except Exception:
-                    continue
-        except Exception as e:
-            print(f'Subreddit search error: {e}')
-        
-        # Convert back to list and parse JSON
-        subreddit_list = []
-        for sub_json in discovered_subreddits:
-            try:
-                subreddit_list.append(json.loads(sub_json))
-            except Exception:
-                continue
-        
-        # Sort by subscriber count (most popular first)
-        subreddit_list.sort(key=lambda x: x['subscribers'], reverse=True)
+            subreddit_list = discover_cache.get(cache_key)
+            if subreddit_list is None:
+                subreddit_list = fetch_discovered_subreddits(reddit, search_term)
+                discover_cache.set(cache_key, subreddit_list)
+        finally:
+            release_reddit_instance(reddit)
         
         # Implement pagination
         start_idx = (page - 1) * limit
@@ -2367,6 +3046,74 @@ def discover_subreddits():
     except Exception as e:
         return jsonify({'error': f'Search failed: {str(e)}', 'success': False})
 
+def fetch_discovered_subreddits(reddit, search_term):
+    """Query Reddit for subreddits matching a search term, most subscribers first"""
+    discovered_subreddits = {}  # display_name -> sub_info, deduplicated by name
+    
+    try:
+        # Search for subreddits by name - get more results
+        subreddit_results = reddit.subreddits.search_by_name(search_term, exact=False)
+        
+        # Also search subreddit content for broader results
+        try:
+            content_results = reddit.subreddit('all').search(f'subreddit:{search_term}', limit=50)
+            additional_subreddits = set()
+            search_term_lower = search_term.lower()
+            for post in content_results:
+                try:
+                    display_name = post.subreddit.display_name
+                    if search_term_lower in display_name.lower():
+                        additional_subreddits.add(display_name)
+                    if len(additional_subreddits) >= 25:
+                        break
+                except:
+                    continue
+            
+            # Add found subreddits to search results
+            for sub_name in additional_subreddits:
+                try:
+                    sub = reddit.subreddit(sub_name)
+                    if len(discovered_subreddits) >= 100:  # Increased limit
+                        break
+                    
+                    sub_info = {
+                        'name': sub.display_name,
+                        'title': sub.title[:100] if hasattr(sub, 'title') and sub.title else sub.display_name,
+                        'description': (sub.public_description or '')[:300] if hasattr(sub, 'public_description') else '',
+                        'subscribers': getattr(sub, 'subscribers', 0) or 0,
+                        'url': f'https://reddit.com/r/{sub.display_name}'
+                    }
+                    if sub_info['subscribers'] > 100:  # Only active subreddits
+                        discovered_subreddits[sub_info['name']] = sub_info
+                except:
+                    continue
+        except:
+            pass
+        
+        # Process direct name search results
+        for sub in subreddit_results:
+            if len(discovered_subreddits) >= 100:  # Increased limit
+                break
+            try:
+                # Get subreddit info
+                sub_info = {
+                    'name': sub.display_name,
+                    'title': sub.title[:100] if hasattr(sub, 'title') and sub.title else sub.display_name,
+                    'description': (sub.public_description or '')[:300] if hasattr(sub, 'public_description') else '',
+                    'subscribers': getattr(sub, 'subscribers', 0) or 0,
+                    'url': f'https://reddit.com/r/{sub.display_name}'
+                }
+                if sub_info['subscribers'] > 100:  # Only include active subreddits
+                    discovered_subreddits[sub_info['name']] = sub_info
+            except Exception:
+                continue
+    except Exception as e:
+        print(f'Subreddit search error: {e}')
+    
+    # Sort by subscriber count (most popular first); every entry is kept since
+    # the whole list is cached and paged through
+    return sorted(discovered_subreddits.values(), key=itemgetter('subscribers'), reverse=True)
+
 def create_mock_subreddits(search_term, page, limit):
     """Create mock subreddit data for testing"""
     base_subreddits = [
@@ -2401,6 +3148,10 @@ def create_mock_subreddits(search_term, page, limit):
 @app.route('/api/advanced_search')
 def api_advanced_search():
     """Advanced search API with filtering and analytics"""
+    started_at = time.perf_counter()
+    reddit = None
+    # Set once a response stream takes over the Reddit instance; iter_posts releases it then
+    streaming = False
     try:
         # Get parameters
         keywords_input = request.args.get('keywords', '').strip()
@@ -2439,28 +3190,22 @@ def api_advanced_search():
                 if len(subreddit_list) == 1:
                     # Single subreddit
                     clean_subreddit = subreddit_list[0]
-                    subreddit_obj = reddit.subreddit(clean_subreddit)
                     
                     # Test if subreddit exists
-                    try:
-                        _ = subreddit_obj.display_name
+                    if accessible_subreddits(reddit, [clean_subreddit]):
+                        subreddit_obj = reddit.subreddit(clean_subreddit)
                         subreddit_display = f'r/{clean_subreddit}'
-                    except Exception:
+                    else:
                         return jsonify({
                             'success': False, 
                             'error': f'Subreddit "{clean_subreddit}" not found or is private. Please check the spelling.'
                         })
                 else:
-                    # Multiple subreddits - combine them
-                    valid_subreddits = []
-                    for sub_name in subreddit_list:
-                        try:
-                            test_sub = reddit.subreddit(sub_name)
-                            _ = test_sub.display_name  # Test if accessible
-                            valid_subreddits.append(sub_name)
-                        except Exception:
-                            # Skip invalid subreddits but continue
-                            continue
+                    # Multiple subreddits - combine them, skipping invalid ones. Very long
+                    # r/a+b+... paths stop working on Reddit's side, so only the first ones are used
+                    requested_count = len(subreddit_list)
+                    subreddit_list = subreddit_list[:MAX_MULTI_SUBREDDITS]
+                    valid_subreddits = accessible_subreddits(reddit, subreddit_list)
                     
                     if not valid_subreddits:
                         return jsonify({
@@ -2470,10 +3215,9 @@ def api_advanced_search():
                     
                     # Create multi-subreddit object using + notation
                     subreddit_obj = reddit.subreddit('+'.join(valid_subreddits))
-                    if len(valid_subreddits) == len(subreddit_list):
-                        subreddit_display = f"{len(valid_subreddits)} subreddits (r/{', r/'.join(valid_subreddits)})"
-                    else:
-                        subreddit_display = f"{len(valid_subreddits)} valid subreddits (r/{', r/'.join(valid_subreddits)})"
+                    # Names dropped past the cap count as skipped, like inaccessible ones
+                    label = 'subreddits' if len(valid_subreddits) == requested_count else 'valid subreddits'
+                    subreddit_display = f"{len(valid_subreddits)} {label} (r/{', r/'.join(valid_subreddits)})"
                     
         except Exception as e:
             return jsonify({
@@ -2488,105 +3232,188 @@ def api_advanced_search():
         # Use pagination for large requests
         batch_size = min(100, max_results) if max_results > 100 else max_results
         
-        try:
-            for post in subreddit_obj.search(search_query, sort=sort_method, limit=max_results):
-                total_fetched += 1
-                
-                try:
-                    # Skip if post is None or deleted
-                    if not post or not hasattr(post, 'title'):
-                        continue
+        # Lowercased once per search rather than per keyword per post
+        keywords_lower = [(kw, kw.lower()) for kw in keywords]
+        compiled_keywords = compile_keywords(tuple(keywords))
+        
+        # Oldest creation timestamp that passes the date filter, computed once per search
+        cutoff_ts = (datetime.now() - timedelta(days=days_back)).timestamp() if days_back > 0 else 0
+        
+        def iter_posts():
+            """Fetch, score and filter posts, yielding each one as soon as it is extracted"""
+            nonlocal total_fetched, processed_count
+            try:
+                # Let Reddit drop posts outside the date range instead of fetching and discarding them
+                listing = subreddit_obj.search(search_query, sort=sort_method, time_filter=time_filter_for_days(days_back), limit=max_results)
+                for post in prefetch(listing):
+                    total_fetched += 1
                     
-                    # Date filtering
-                    if days_back > 0:
-                        post_date = datetime.fromtimestamp(post.created_utc)
-                        cutoff_date = datetime.now() - timedelta(days=days_back)
-                        if post_date < cutoff_date:
+                    try:
+                        # Skip if post is None or deleted
+                        if not post:
+                            continue
+                        # Listing results arrive fully loaded, so read their fields straight from the instance dict
+                        fields = vars(post)
+                        if 'title' not in fields:
                             continue
-                    
-                    # Calculate metrics
-                    text_to_analyze = f"{post.title} {post.selftext or ''}"
-                    sentiment, sentiment_score = simple_sentiment(text_to_analyze)
-                    relevance_score, engagement_rate = calculate_metrics(post, keywords)
-                    
-                    # Apply filters
-                    if post.score < min_score:
-                        continue
-                    if post.num_comments < min_comments:
-                        continue
-                    if engagement_rate < min_engagement:
-                        continue
-                    if sentiment_filter != 'all' and sentiment != sentiment_filter:
-                        continue
-                    
-                    # Extract post data safely
-                    post_data = {
-                        'title': post.title[:200] if post.title else '[No Title]',
-                        'subreddit': str(post.subreddit) if post.subreddit else 'unknown',
-                        'author': str(post.author) if post.author else '[deleted]',
-                        'score': max(0, post.score) if hasattr(post, 'score') else 0,
-                        'upvote_ratio': round(post.upvote_ratio, 3) if hasattr(post, 'upvote_ratio') else 0.5,
-                        'num_comments': max(0, post.num_comments) if hasattr(post, 'num_comments') else 0,
-                        'created_utc': datetime.fromtimestamp(post.created_utc).strftime('%Y-%m-%d %H:%M:%S'),
-                        'date': datetime.fromtimestamp(post.created_utc).strftime('%d-%m-%Y'),
-                        'url': f"https://reddit.com{post.permalink}" if hasattr(post, 'permalink') else '#',
-                        'content': (post.selftext[:500] + '...') if post.selftext and len(post.selftext) > 500 else (post.selftext or ''),
-                        'nsfw': bool(post.over_18) if hasattr(post, 'over_18') else False,
-                        'post_id': str(post.id) if hasattr(post, 'id') else f'unknown_{processed_count}',
-                        'sentiment': sentiment,
-                        'sentiment_score': round(sentiment_score, 4),
-                        'engagement_rate': round(engagement_rate, 2),
-                        'relevance_score': relevance_score,
-                        'keywords_found': ', '.join([kw for kw in keywords if kw.lower() in (post.title or '').lower() or kw.lower() in (post.selftext or '').lower()])
-                    }
-                    posts.append(post_data)
-                    processed_count += 1
-                    
-                    # Add small delay for large requests to be respectful
-                    if processed_count % 50 == 0 and max_results > 100:
-                        import time
-                        time.sleep(0.1)
                         
-                except Exception as post_error:
-                    # Continue processing other posts if one fails
-                    continue
+                        # Cheap numeric filters first, so dropped posts never reach sentiment scoring
+                        if fields['created_utc'] < cutoff_ts:
+                            continue
+                        score = fields['score']
+                        num_comments = fields['num_comments']
+                        if score < min_score:
+                            continue
+                        if num_comments < min_comments:
+                            continue
+                        if compute_engagement_rate(score, num_comments) < min_engagement:
+                            continue
+                        
+                        # Score sentiment only for posts that survived the cheap filters
+                        title = fields['title'] or ''
+                        selftext = fields.get('selftext') or ''
+                        sentiment, sentiment_score = simple_sentiment(f"{title} {selftext}")
+                        if sentiment_filter != 'all' and sentiment != sentiment_filter:
+                            continue
+                        
+                        # Search listings always carry these fields; a malformed post raises and is skipped
+                        post_subreddit = fields['subreddit']
+                        author = fields.get('author')
+                        # Broken down once and shared by both date strings
+                        created = time.localtime(fields['created_utc'])
+                        # Lowercased once and shared by relevance scoring and keywords_found
+                        title_lower = title.lower()
+                        body_lower = selftext.lower()
+                        
+                        # Calculate metrics
+                        relevance_score = calculate_relevance(title_lower, body_lower, compiled_keywords)
+                        engagement_rate = compute_engagement_rate(fields['score'], fields['num_comments'])
+                        
+                        # Extract post data safely
+                        post_data = {
+                            'title': title[:200] if title else '[No Title]',
+                            'subreddit': sys.intern(post_subreddit.display_name),
+                            'author': sys.intern(author.name) if author else '[deleted]',
+                            'score': max(0, fields['score']),
+                            'upvote_ratio': round(fields['upvote_ratio'], 3),
+                            'num_comments': max(0, fields['num_comments']),
+                            'created_utc': time.strftime('%Y-%m-%d %H:%M:%S', created),
+                            'date': time.strftime('%d-%m-%Y', created),
+                            'url': f"https://reddit.com{fields['permalink']}",
+                            'content': (selftext[:500] + '...') if len(selftext) > 500 else selftext,
+                            'nsfw': bool(fields.get('over_18', False)),
+                            'post_id': fields['id'],
+                            'sentiment': sentiment,
+                            'sentiment_score': round(sentiment_score, 4),
+                            'engagement_rate': round(engagement_rate, 2),
+                            'relevance_score': relevance_score,
+                            'keywords_found': ', '.join([kw for kw, kw_lower in keywords_lower if kw_lower in title_lower or kw_lower in body_lower])
+                        }
+                        posts.append(post_data)
+                        processed_count += 1
+                    except Exception as post_error:
+                        # Continue processing other posts if one fails
+                        continue
                     
-        except Exception as search_error:
-            return jsonify({
-                'success': False, 
-                'error': f'Search failed: {str(search_error)}'
-            })
+                    yield post_data
+            finally:
+                # The listing is fully consumed or abandoned, so its Reddit instance is free again
+                release_reddit_instance(reddit)
+        
+        def notify_search():
+            """Kick off Slack notifications for the collected posts"""
+            # Process Slack notifications in background
+            search_data = {
+                'keywords': search_query,
+                'subreddit_display': subreddit_display,
+                'total_posts': len(posts)
+            }
+            process_slack_notifications(search_data, posts)
         
-        # Calculate actual search time based on processing
-        search_time = max(0.5, processed_count * 0.05) + (max_results / 1000)
+        def stream_posts():
+            """Yield posts as they are processed, notifying Slack once every post is collected"""
+            source = iter_posts()
+            try:
+                for post_data in source:
+                    yield post_data
+            except GeneratorExit:
+                # The client went away mid-stream: finish the search anyway so its
+                # notifications still go out, as they did before responses streamed
+                try:
+                    for post_data in source:
+                        pass
+                except Exception:
+                    pass
+                else:
+                    notify_search()
+                raise
+            notify_search()
         
-        # Process Slack notifications in background
-        search_data = {
-            'keywords': search_query,
-            'subreddit_display': subreddit_display,
-            'total_posts': len(posts)
-        }
-        process_slack_notifications(search_data, posts)
+        def finish_search():
+            """Build the search summary"""
+            search_time = time.perf_counter() - started_at
+            
+            return {
+                'success': True,
+                'total_posts': len(posts),
+                'total_fetched': total_fetched,
+                'processed_count': processed_count,
+                'search_query': search_query,
+                'subreddit_searched': subreddit_display,
+                'search_time': f"{search_time:.2f} seconds"
+            }
         
-        return jsonify({
-            'success': True,
-            'total_posts': len(posts),
-            'total_fetched': total_fetched,
-            'processed_count': processed_count,
-            'search_query': search_query,
-            'subreddit_searched': subreddit_display,
-            'search_time': f"{search_time:.2f} seconds",
-            'posts': posts
-        })
+        # Newline-delimited JSON: one line per post as it is processed, then a summary line
+        if request.args.get('format') == 'ndjson':
+            def generate():
+                try:
+                    for post_data in stream_posts():
+                        yield encode_json({'type': 'post', 'post': post_data}) + b'\n'
+                except Exception as search_error:
+                    yield encode_json({
+                        'type': 'error',
+                        'success': False,
+                        'error': f'Search failed: {str(search_error)}'
+                    }) + b'\n'
+                    return
+                yield encode_json({'type': 'summary', **finish_search()}) + b'\n'
+            
+            streaming = True
+            return Response(generate(), mimetype='application/x-ndjson')
+        
+        # Plain JSON, streamed: each post is encoded as it is processed and the summary
+        # fields follow the posts array, so the whole response never sits in memory twice
+        def generate_json():
+            yield b'{"posts":['
+            try:
+                for index, post_data in enumerate(stream_posts()):
+                    yield (b',' if index else b'') + encode_json(post_data)
+            except Exception as search_error:
+                yield b'],' + encode_json({
+                    'success': False,
+                    'error': f'Search failed: {str(search_error)}'
+                })[1:]
+                return
+            yield b'],' + encode_json(finish_search())[1:]
+        
+        streaming = True
+        return Response(stream_with_context(generate_json()), mimetype='application/json')
         
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
+    finally:
+        if not streaming:
+            release_reddit_instance(reddit)
 
 @app.route('/download_excel', methods=['POST'])
 def download_excel():
     """Generate and download Excel file"""
     try:
-        data = json.loads(request.form.get('data', '{}'))
+        # The dashboard posts JSON; keep accepting the legacy form-encoded payload
+        if request.is_json:
+            data = decode_json(request.get_data())
+        else:
+            data = decode_json(request.form.get('data', '{}'))
         posts = data.get('posts', [])
         query = data.get('query', 'reddit_search')
         
@@ -2596,13 +3423,19 @@ def download_excel():
         # Create DataFrame
         df = pd.DataFrame(posts)
         
-        # Create Excel file in memory
+        # Create Excel file in memory (xlsxwriter keeps far less per-cell state than openpyxl)
         output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
             # Main data sheet
             df.to_excel(writer, sheet_name='Reddit_Data', index=False)
             
             # Summary sheet with enhanced metrics
+            sentiment_share = df['sentiment'].value_counts(normalize=True)
+            if df.empty:
+                top_titles = ['N/A'] * 3
+            else:
+                top_idx = df[['score', 'num_comments', 'engagement_rate']].idxmax()
+                top_titles = [title[:50] + '...' for title in df.loc[top_idx, 'title']]
             summary_data = {
                 'Metric': [
                     'Search Query', 'Total Posts Found', 'Unique Subreddits', 'Export Date',
@@ -2619,14 +3452,12 @@ def download_excel():
                     round(df['score'].mean(), 2),
                     round(df['num_comments'].mean(), 2),
                     df['num_comments'].sum(),
-                    round((df['sentiment'] == 'positive').mean() * 100, 1),
-                    round((df['sentiment'] == 'negative').mean() * 100, 1),
-                    round((df['sentiment'] == 'neutral').mean() * 100, 1),
+                    round(sentiment_share.get('positive', 0) * 100, 1),
+                    round(sentiment_share.get('negative', 0) * 100, 1),
+                    round(sentiment_share.get('neutral', 0) * 100, 1),
                     round(df['relevance_score'].mean(), 2),
                     round(df['engagement_rate'].mean(), 2),
-                    df.loc[df['score'].idxmax(), 'title'][:50] + '...' if not df.empty else 'N/A',
-                    df.loc[df['num_comments'].idxmax(), 'title'][:50] + '...' if not df.empty else 'N/A',
-                    df.loc[df['engagement_rate'].idxmax(), 'title'][:50] + '...' if not df.empty else 'N/A'
+                    *top_titles
                 ]
             }
             pd.DataFrame(summary_data).to_excel(writer, sheet_name='Summary', index=False)
@@ -2643,7 +3474,7 @@ def download_excel():
         filename = f"reddit_scraper_results_{query.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         
         return send_file(
-            io.BytesIO(output.getvalue()),
+            output,
             mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             as_attachment=True,
             download_name=filename
@@ -2658,13 +3489,49 @@ def download_excel():
 
 # ============ SLACK BOT SLASH COMMANDS ============
 
+# Background searches for slash commands run on a fixed pool instead of a thread per command
+SLACK_SEARCH_WORKERS = 8
+SLACK_SEARCH_QUEUE_LIMIT = 32
+slack_search_pool = ThreadPoolExecutor(max_workers=SLACK_SEARCH_WORKERS, thread_name_prefix='slack-search')
+# Caps searches that are running or waiting, so bursts can't pile up unbounded work
+slack_search_slots = BoundedSemaphore(SLACK_SEARCH_QUEUE_LIMIT)
+# Keep-alive session for posting search results back to Slack, one pooled connection per worker
+slack_response_session = requests.Session()
+slack_response_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=SLACK_SEARCH_WORKERS))
+
+def submit_slack_search(keywords, subreddit, max_results, sort_method, response_url, user_name, workspace, user_id):
+    """Queue a slash command search on the worker pool, returning False if the queue is full"""
+    if not slack_search_slots.acquire(blocking=False):
+        return False
+    
+    def on_done(future):
+        slack_search_slots.release()
+        error = future.exception()
+        if error:
+            print(f"[SLACK SEARCH] Background search failed: {error}")
+            log_notification_attempt('slack_command', False, f'Slash command search failed: {error}', {
+                'keywords': ', '.join(keywords),
+                'subreddit_display': subreddit
+            })
+    
+    try:
+        future = slack_search_pool.submit(
+            perform_slack_search,
+            keywords, subreddit, max_results, sort_method, response_url, user_name, workspace, user_id
+        )
+    except RuntimeError:
+        slack_search_slots.release()
+        return False
+    future.add_done_callback(on_done)
+    return True
+
 @app.route('/api/slack/command', methods=['POST'])
 def handle_slack_command():
     """Handle Slack slash commands from any workspace"""
     try:
         # Verify the request is from Slack
         if request.form.get('command') != '/reddit':
-            return jsonify({'text': 'Unknown command'})
+            return json_response({'text': 'Unknown command'})
         
         # Extract workspace and user info
         team_id = request.form.get('team_id')
@@ -2680,20 +3547,20 @@ def handle_slack_command():
         # Get workspace data
         workspace = get_workspace_by_team_id(team_id)
         if not workspace:
-            return jsonify({
+            return json_response({
                 'response_type': 'ephemeral',
                 'text': '❌ **Reddit Scraper Pro not properly installed**\n\nPlease reinstall the app or contact your workspace admin.\n\n[Install Link](https://scrapper-eight-alpha.vercel.app/slack/install)'
             })
         
         # Check if workspace is active
         if not workspace.get('is_active'):
-            return jsonify({
+            return json_response({
                 'response_type': 'ephemeral',
                 'text': '⚠️ This workspace installation is currently disabled. Contact support for assistance.'
             })
         
         # Rate limiting check (per user per hour)
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         # Check recent usage for this user
@@ -2707,17 +3574,17 @@ def handle_slack_command():
         user_hourly_limit = 10  # 10 commands per hour per user
         
         if recent_usage >= user_hourly_limit:
-            conn.close()
-            return jsonify({
+            release_db_connection(conn)
+            return json_response({
                 'response_type': 'ephemeral',
                 'text': f'⚠️ **Rate Limit Exceeded**\n\nYou can use up to {user_hourly_limit} commands per hour. Please try again later.\n\n**Time until reset:** {60 - datetime.now().minute} minutes'
             })
         
-        conn.close()
+        release_db_connection(conn)
         
         # Check usage limits
         if workspace['usage_count'] >= workspace['usage_limit']:
-            return jsonify({
+            return json_response({
                 'response_type': 'ephemeral',
                 'text': f'🚫 **Monthly Usage Limit Reached**\n\nYour workspace has used {workspace["usage_count"]}/{workspace["usage_limit"]} searches this month.\n\n**Plan:** {workspace["plan_type"].title()}\n**Upgrade** to continue using Reddit Scraper Pro.'
             })
@@ -2725,7 +3592,7 @@ def handle_slack_command():
         # Parse command
         
         if not text:
-            return jsonify({
+            return json_response({
                 'response_type': 'ephemeral',
                 'text': '''🔍 **Reddit Scraper Pro - Commands**
 
@@ -2748,7 +3615,7 @@ def handle_slack_command():
         
         # Handle help command
         if text.lower() in ['help', '--help', '-h']:
-            return jsonify({
+            return json_response({
                 'response_type': 'ephemeral',
                 'text': '''🔍 **Reddit Scraper Pro - Help**
 
@@ -2775,8 +3642,10 @@ def handle_slack_command():
         
         # Handle status command
         if text.lower() in ['status', '--status']:
-            reddit_status = "✅ Connected" if get_reddit_instance() else "❌ Not configured"
-            return jsonify({
+            reddit = get_reddit_instance()
+            release_reddit_instance(reddit)
+            reddit_status = "✅ Connected" if reddit else "❌ Not configured"
+            return json_response({
                 'response_type': 'ephemeral',
                 'text': f'''📊 **Reddit Scraper Pro - Status**
 
@@ -2794,7 +3663,7 @@ def handle_slack_command():
         
         # Parse search command
         if not text.startswith('search '):
-            return jsonify({
+            return json_response({
                 'response_type': 'ephemeral',
                 'text': f'❌ Unknown command: `{text}`\n\nTry: `/reddit search AI startups` or `/reddit help`'
             })
@@ -2803,7 +3672,7 @@ def handle_slack_command():
         search_text = text[7:].strip()  # Remove 'search '
         
         if not search_text:
-            return jsonify({
+            return json_response({
                 'response_type': 'ephemeral',
                 'text': '❌ Please provide keywords to search.\n\nExample: `/reddit search AI machine learning`'
             })
@@ -2825,15 +3694,16 @@ def handle_slack_command():
         
         # Start background search (non-blocking)
         if response_url:
-            Thread(
-                target=perform_slack_search,
-                args=(keywords, subreddit, max_results, sort_method, response_url, user_name, workspace, user_id)
-            ).start()
+            if not submit_slack_search(keywords, subreddit, max_results, sort_method, response_url, user_name, workspace, user_id):
+                return json_response({
+                    'response_type': 'ephemeral',
+                    'text': '⏳ Too many searches are running right now. Please try again in a moment.'
+                })
         
-        return jsonify(immediate_response)
+        return json_response(immediate_response)
         
     except Exception as e:
-        return jsonify({
+        return json_response({
             'response_type': 'ephemeral',
             'text': f'❌ Error processing command: {str(e)}'
         })
@@ -2898,18 +3768,21 @@ def perform_slack_search(keywords, subreddit, max_results, sort_method, response
         search_query = ' OR '.join(keywords)
         
         # Perform search (reuse existing logic)
-        results = perform_reddit_search(
-            reddit=reddit,
-            keywords=keywords,
-            subreddit=subreddit,
-            max_results=max_results,
-            sort_method=sort_method,
-            days_back=0,
-            min_score=0,
-            min_comments=0,
-            min_engagement=0.0,
-            sentiment_filter='all'
-        )
+        try:
+            results = perform_reddit_search(
+                reddit=reddit,
+                keywords=keywords,
+                subreddit=subreddit,
+                max_results=max_results,
+                sort_method=sort_method,
+                days_back=0,
+                min_score=0,
+                min_comments=0,
+                min_engagement=0.0,
+                sentiment_filter='all'
+            )
+        finally:
+            release_reddit_instance(reddit)
         
         print(f"[SLACK SEARCH] Search completed. Success: {results['success']}")
         
@@ -3024,6 +3897,13 @@ def create_mock_search_results(keywords, subreddit, user_name):
 
 def perform_reddit_search(reddit, keywords, subreddit, max_results, sort_method, days_back, min_score, min_comments, min_engagement, sentiment_filter):
     """Core Reddit search function (reusable for both web and Slack)"""
+    # Identical searches repeated within a couple of minutes reuse the earlier result
+    cache_key = (tuple(keywords), subreddit.lower(), max_results, sort_method, days_back,
+                 min_score, min_comments, min_engagement, sentiment_filter)
+    cached = reddit_search_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
         # Build search query
         search_query = ' OR '.join(keywords)
@@ -3051,38 +3931,51 @@ def perform_reddit_search(reddit, keywords, subreddit, max_results, sort_method,
         elif sort_method == 'new':
             search_results = subreddit_obj.new(limit=max_results)
         elif sort_method == 'top':
-            search_results = subreddit_obj.top('all', limit=max_results)
+            search_results = subreddit_obj.top(time_filter_for_days(days_back), limit=max_results)
         else:
             # Use search for relevance
-            search_results = subreddit_obj.search(search_query, sort='relevance', limit=max_results)
+            search_results = subreddit_obj.search(search_query, sort='relevance', time_filter=time_filter_for_days(days_back), limit=max_results)
+        
+        # Oldest creation timestamp that passes the date filter, computed once per search
+        cutoff_ts = (datetime.now() - timedelta(days=days_back)).timestamp() if days_back > 0 else 0
+        compiled_keywords = compile_keywords(tuple(keywords))
         
         # Process results
         posts = []
-        for post in search_results:
+        for post in prefetch(search_results):
             try:
-                # Calculate metrics
-                relevance_score, engagement_rate = calculate_metrics(post, keywords)
-                sentiment, sentiment_score = simple_sentiment(f"{post.title} {post.selftext or ''}")
+                # Read listing fields from the instance dict: a missing attribute on a PRAW
+                # object would otherwise trigger a blocking fetch of the whole submission
+                fields = vars(post)
                 
-                # Apply filters
-                if post.score < min_score or post.num_comments < min_comments:
+                # Cheap attribute filters first, so dropped posts skip metrics and sentiment
+                if fields['score'] < min_score or fields['num_comments'] < min_comments:
+                    continue
+                if fields['created_utc'] < cutoff_ts:
                     continue
-                if engagement_rate < min_engagement:
+                if compute_engagement_rate(fields['score'], fields['num_comments']) < min_engagement:
                     continue
+                
+                selftext = fields.get('selftext') or ''
+                sentiment, sentiment_score = simple_sentiment(f"{fields['title']} {selftext}")
                 if sentiment_filter != 'all' and sentiment != sentiment_filter:
                     continue
                 
+                # Calculate metrics
+                relevance_score, engagement_rate = calculate_metrics(post, compiled_keywords)
+                
+                author = fields.get('author')
                 post_data = {
-                    'id': post.id,
-                    'title': post.title,
-                    'url': post.url,
-                    'score': post.score,
-                    'num_comments': post.num_comments,
-                    'subreddit': post.subreddit.display_name,
-                    'author': str(post.author) if post.author else '[deleted]',
-                    'created_utc': post.created_utc,
-                    'date': datetime.fromtimestamp(post.created_utc).strftime('%Y-%m-%d %H:%M'),
-                    'selftext': (post.selftext or '')[:500],  # Limit text
+                    'id': fields['id'],
+                    'title': fields['title'],
+                    'url': fields['url'],
+                    'score': fields['score'],
+                    'num_comments': fields['num_comments'],
+                    'subreddit': sys.intern(fields['subreddit'].display_name),
+                    'author': sys.intern(author.name) if author else '[deleted]',
+                    'created_utc': fields['created_utc'],
+                    'date': time.strftime('%Y-%m-%d %H:%M', time.localtime(fields['created_utc'])),
+                    'selftext': selftext[:500],  # Limit text
                     'relevance_score': relevance_score,
                     'engagement_rate': engagement_rate,
                     'sentiment': sentiment,
@@ -3093,13 +3986,15 @@ def perform_reddit_search(reddit, keywords, subreddit, max_results, sort_method,
             except Exception as e:
                 continue  # Skip problematic posts
         
-        return {
+        results = {
             'success': True,
             'posts': posts,
             'search_query': search_query,
             'subreddit_searched': subreddit_display,
             'total_posts': len(posts)
         }
+        reddit_search_cache.set(cache_key, results)
+        return results
         
     except Exception as e:
         return {
@@ -3121,15 +4016,26 @@ def format_slack_search_results(posts, keywords, subreddit, user_name):
             }]
         }
     
-    # Calculate summary stats
+    # Calculate summary stats and the top 5 posts by engagement in a single pass
     total_posts = len(posts)
-    avg_score = sum(p['score'] for p in posts) / total_posts
-    total_comments = sum(p['num_comments'] for p in posts)
-    positive_posts = len([p for p in posts if p['sentiment'] == 'positive'])
-    positive_pct = (positive_posts / total_posts * 100) if total_posts > 0 else 0
+    total_score = 0
+    total_comments = 0
+    positive_posts = 0
+    top_heap = []  # (engagement_rate, -index, post); -index keeps earlier posts first on ties
+    for index, post in enumerate(posts):
+        total_score += post['score']
+        total_comments += post['num_comments']
+        if post['sentiment'] == 'positive':
+            positive_posts += 1
+        entry = (post['engagement_rate'], -index, post)
+        if len(top_heap) < 5:
+            heapq.heappush(top_heap, entry)
+        elif entry > top_heap[0]:
+            heapq.heapreplace(top_heap, entry)
     
-    # Get top 5 posts by engagement
-    top_posts = sorted(posts, key=lambda x: x['engagement_rate'], reverse=True)[:5]
+    avg_score = total_score / total_posts
+    positive_pct = (positive_posts / total_posts * 100) if total_posts > 0 else 0
+    top_posts = [post for _, _, post in sorted(top_heap, reverse=True)]
     
     # Format subreddit display
     subreddit_display = f'r/{subreddit}' if subreddit != 'all' else 'all of Reddit'
@@ -3198,11 +4104,10 @@ def format_slack_search_results(posts, keywords, subreddit, user_name):
 def post_slack_response(response_url, data):
     """Post response to Slack using response URL"""
     try:
-        import requests
         print(f"[SLACK POST] Posting to: {response_url[:50]}...")
         print(f"[SLACK POST] Data preview: {str(data)[:200]}...")
         
-        response = requests.post(response_url, json=data, timeout=15)
+        response = slack_response_session.post(response_url, data=encode_json(data), headers=JSON_HEADERS, timeout=15)
         
         print(f"[SLACK POST] Response status: {response.status_code}")
         print(f"[SLACK POST] Response text: {response.text[:200]}")